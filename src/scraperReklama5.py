@@ -9,28 +9,33 @@ import os
 import csv
 import json
 import warnings
-import socket
 import threading
 from dataclasses import dataclass, asdict, replace
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from itertools import islice
+from itertools import count, takewhile
+from operator import eq, itemgetter
 from datetime import datetime, timedelta
-from collections import defaultdict
 from typing import Dict, List, Optional, Tuple, Union
-from urllib import request as urllib_request
-from urllib import error as urllib_error
 from urllib.parse import urlsplit, urlunsplit, quote_plus
 
 from storage import sqlite_store
 
-from bs4 import BeautifulSoup
-
 try:
     from urllib3.exceptions import NotOpenSSLWarning
     warnings.filterwarnings("ignore", category=NotOpenSSLWarning)
 except Exception:
     pass
 
+import urllib3
+from lxml import etree
+from lxml import html as lxml_html
+
+try:
+    import orjson
+except ImportError:  # optional speed-up, stdlib json is used otherwise
+    orjson = None
+
 DEFAULT_BASE_URL_TEMPLATE = "https://www.reklama5.mk/Search?city=&cat=24&q={search_term}&page={page_num}"
 BASE_URL_TEMPLATE = DEFAULT_BASE_URL_TEMPLATE
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -45,6 +50,7 @@ CSV_FIELDNAMES = [
 ]
 
 DB_FIELDNAMES = [name for name in CSV_FIELDNAMES if name != "promoted"]
+CSV_ROW_GETTER = itemgetter(*CSV_FIELDNAMES)
 
 DETAIL_ONLY_FIELDS = [
     "fuel",
@@ -67,9 +73,22 @@ OVERVIEW_COMPARISON_FIELDS = [
     "date",
 ]
 
-STATUS_COMPARISON_FIELDS = list(OVERVIEW_COMPARISON_FIELDS)
+STATUS_COMPARISON_FIELDS = tuple(OVERVIEW_COMPARISON_FIELDS)
+
+# Fields a changed listing inherits from the stored row when the overview
+# leaves them empty, so the recomputed hash does not flag them as removed.
+HASH_FALLBACK_FIELDS = tuple(DETAIL_ONLY_FIELDS) + (
+    "km",
+    "kw",
+    "ps",
+    "year",
+    "price",
+    "city",
+    "link",
+)
 
 DATE_COMPARISON_TOLERANCE = timedelta(hours=1)
+DATE_COMPARISON_TOLERANCE_SECONDS = DATE_COMPARISON_TOLERANCE.total_seconds()
 
 INLINE_PROGRESS_SYMBOL = "•"
 
@@ -98,19 +117,126 @@ DETAIL_FIELD_MAP = {
     "kласа на емисија": "emission_class"
 }
 
+# Labels exactly as the site renders them ("Марка:") resolve with one dict
+# hit; anything else goes through the full strip/lower normalization.
+DETAIL_LABEL_LOOKUP = {}
+for _label, _field in DETAIL_FIELD_MAP.items():
+    for _variant in (_label, _label.capitalize()):
+        DETAIL_LABEL_LOOKUP[_variant] = _field
+        DETAIL_LABEL_LOOKUP[_variant + ":"] = _field
+DETAIL_FIELD_FIRST_CHARS = frozenset(label[0] for label in DETAIL_FIELD_MAP)
+
 MK_MONTHS = {
     "јан":1, "фев":2, "мар":3, "апр":4,
     "мај":5, "јун":6, "јул":7, "авг":8,
     "сеп":9, "окт":10, "ное":11, "дек":12
 }
 
+# Patterns used per listing row are compiled once instead of going through
+# the ``re`` module cache on every call.
+RE_AD_ID       = re.compile(r"ad=(\d+)")
+RE_YEAR        = re.compile(r"\b(19|20)\d{2}\b")
+RE_DESC_YEAR   = re.compile(r"(\b19|20)\d{2}\b")
+RE_KM_DESC     = re.compile(r"(\d{1,3}(?:[\.,]\d{3})*|\d+)\s*km", re.IGNORECASE)
+RE_KW_DESC     = re.compile(r"(\d+)\s*kW", re.IGNORECASE)
+RE_PS_PAREN    = re.compile(r"\((\d+)\s*Hp\)", re.IGNORECASE)
+RE_PS_BARE     = re.compile(r"(\d+)\s*HP", re.IGNORECASE)
+RE_SPEC_YEAR   = re.compile(r"\b((?:19|20)\d{2})\b", re.IGNORECASE)
+RE_SPEC_KM     = re.compile(r"([\d\.\,\s]+)\s*(?:km|км)", re.IGNORECASE)
+RE_SPEC_KW     = re.compile(r"([\d\.\,\s]+)\s*(?:kW|кW|кв)", re.IGNORECASE)
+RE_SPEC_PS     = re.compile(r"\((\d+)\s*(?:Hp|HP|кс)\)", re.IGNORECASE)
+RE_POWER_KW    = re.compile(r"(\d+)\s*(?:kw|кw|кв)")
+RE_POWER_PS    = re.compile(r"(\d+)\s*(?:ks|кс|hp)")
+RE_PRICE_ON_REQUEST = re.compile(r"(ПоДоговор|дог|nachVereinbarung|1€)", re.IGNORECASE)
+RE_PRICE_NUMBER = re.compile(r"-?[\d\s\.,]+")
+
+
+class _AsciiDigitFilter(dict):
+    """``str.translate`` table that keeps ASCII digits and drops everything else.
+
+    Unknown code points are added as deletions on first sight, so repeated
+    characters are plain dict hits inside the C translate loop.
+    """
+
+    def __missing__(self, codepoint):
+        self[codepoint] = None
+        return None
+
+
+_DIGITS_ONLY = _AsciiDigitFilter({ord(digit): digit for digit in "0123456789"})
+
 
 DETAIL_DELAY_UNSET = object()
 
+MAX_DETAIL_WORKERS = 5
+
+# Result pages are paced by a token bucket (see ``TokenBucket``): at most one
+# page every 2.5 s, page 1 included. The bucket holds a single token, so even
+# after a slow page two requests never go out back to back. The wait runs in
+# the prefetch thread, so detail enrichment of the current page overlaps
+# with it.
+LISTING_PAGE_RATE = 0.4
+LISTING_PAGE_BURST = 1
+
+# One pool for all requests against reklama5.mk so that listing and detail
+# fetches reuse keep-alive connections instead of a new TCP/TLS handshake
+# per request. The pool keeps one connection per possible detail worker;
+# with urllib3's default of a single connection, parallel workers would
+# open extra sockets and throw them away after every request. The pool
+# itself only follows redirects; the fetch helpers pass a per-request Retry
+# (see ``_build_retry``) so urllib3 handles retries and backoff. Pages are
+# requested compressed; urllib3 decodes gzip/deflate bodies transparently.
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; reklama5-scraper/1.0)",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+HTTP_POOL = urllib3.PoolManager(
+    maxsize=MAX_DETAIL_WORKERS,
+    headers=REQUEST_HEADERS,
+    retries=urllib3.Retry(total=None, connect=0, read=0, status=0, other=0, redirect=5),
+)
+
+# Connecting is quick or not happening at all; only reading a page may take
+# a while. A separate connect timeout lets a dead host fail (and retry)
+# after seconds instead of waiting out the whole read budget.
+LISTING_PAGE_TIMEOUT = urllib3.Timeout(connect=5, read=20)
+DETAIL_PAGE_TIMEOUT = urllib3.Timeout(connect=5, read=15)
+
+# Transient failures worth another attempt: rate limiting (429, honouring a
+# Retry-After header) and server-side errors. Everything else in the 4xx/5xx
+# range is returned immediately and surfaces as HttpStatusError.
+RETRY_HTTP_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Retry sleeps grow exponentially from ``backoff_seconds`` but never exceed
+# this cap. Each sleep gets up to ``backoff_seconds`` of random jitter so
+# parallel detail workers that failed together do not retry in lockstep.
+RETRY_BACKOFF_MAX = 30
+
+# Removed ads answer with 404/410; retrying those only burns the backoff
+# sleeps. Detail URLs that turned out to be gone are remembered for the rest
+# of the process so repeated lookups skip the network entirely.
+GONE_HTTP_STATUSES = frozenset({404, 410})
+_missing_detail_urls = set()
+
 SETTINGS_DIR = DATA_DIR
 USER_SETTINGS_FILE = os.path.join(SETTINGS_DIR, "user_settings.json")
 
 
+def _json_dumps(data):
+    """Serialize ``data`` as indented UTF-8 JSON text (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def _json_loads(raw):
+    """Parse JSON from ``bytes``; errors are ``json.JSONDecodeError`` either way."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
 def format_duration(seconds):
     try:
         total_seconds = int(round(float(seconds)))
@@ -184,9 +310,9 @@ def load_user_settings():
     if not os.path.isfile(USER_SETTINGS_FILE):
         return UserSettings()
     try:
-        with open(USER_SETTINGS_FILE, mode="r", encoding="utf-8") as f:
-            raw = json.load(f)
-    except (OSError, json.JSONDecodeError):
+        with open(USER_SETTINGS_FILE, mode="rb") as f:
+            raw = _json_loads(f.read())
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
         return UserSettings()
     base_url = raw.get("base_url_template") or DEFAULT_BASE_URL_TEMPLATE
     days = raw.get("days", 1)
@@ -244,7 +370,7 @@ def save_user_settings(settings: UserSettings):
     os.makedirs(SETTINGS_DIR, exist_ok=True)
     data = _serialize_user_settings(settings)
     with open(USER_SETTINGS_FILE, mode="w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write(_json_dumps(data))
 
 
 current_settings = load_user_settings()
@@ -264,8 +390,19 @@ def _update_settings(**kwargs):
 
 _apply_settings_to_globals()
 
+# Home the cursor, clear the screen and the scrollback, like clear(1).
+ANSI_CLEAR_SCREEN = "\x1b[H\x1b[2J\x1b[3J"
+
+
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # The classic Windows console only understands ANSI sequences once VT
+    # mode is enabled, so it keeps using cls there.
+    if os.name == 'nt':
+        os.system('cls')
+        return
+    if sys.stdout.isatty():
+        sys.stdout.write(ANSI_CLEAR_SCREEN)
+        sys.stdout.flush()
 
 
 def _build_developer_logger(enabled):
@@ -288,25 +425,39 @@ def print_section(title):
     print(f"\n{line}\n{title}\n{line}")
 
 
+def print_lines(lines):
+    """Print ``lines`` with a single write (one terminal flush instead of one per line)."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def build_inline_progress_printer(total, symbol=INLINE_PROGRESS_SYMBOL):
+    """``(callback, finalize)`` printing one ``symbol`` per finished item.
+
+    ``enrich_listings_with_details`` calls back from its merge loop on the
+    calling thread, so the counter needs no lock. Each step is a single
+    write + flush; the last one carries the line break.
+    """
     if total <= 0:
         return None, None
 
-    state = {"count": 0, "done": False}
+    completed = count(1)
+    state = {"done": False}
 
     def callback():
         if state["done"]:
             return
-        print(symbol, end="", flush=True)
-        state["count"] += 1
-        if state["count"] >= total:
-            print()
+        if next(completed) >= total:
             state["done"] = True
+            sys.stdout.write(symbol + "\n")
+        else:
+            sys.stdout.write(symbol)
+        sys.stdout.flush()
 
     def finalize():
         if not state["done"]:
-            print()
             state["done"] = True
+            sys.stdout.write("\n")
+            sys.stdout.flush()
 
     return callback, finalize
 
@@ -613,37 +764,281 @@ def build_base_url_template(raw_input):
     new_query = _rebuild_query_string(query_pairs)
     return urlunsplit((parsed.scheme, parsed.netloc, parsed.path, new_query, parsed.fragment))
 
+def _response_charset(response, default="utf-8"):
+    content_type = response.headers.get("Content-Type") or ""
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "charset" and value:
+            return value.strip("\"' ")
+    return default
+
+
+class HttpStatusError(urllib3.exceptions.HTTPError):
+    """Raised by ``_http_get`` for responses with an HTTP error status."""
+
+    def __init__(self, status, reason):
+        super().__init__(f"HTTP {status} {reason}")
+        self.status = status
+
+
+def _is_gone_error(exc):
+    return getattr(exc, "status", None) in GONE_HTTP_STATUSES
+
+
+class _FetchRetry(urllib3.Retry):
+    """``urllib3.Retry`` that already waits before the first retry.
+
+    Stock urllib3 retries the first failure immediately and then sleeps
+    ``2 * backoff_factor``, ``4 * backoff_factor``, ... The fetchers keep
+    their previous schedule instead: ``backoff_factor`` before the first
+    retry, doubling after that (plus jitter, capped at ``backoff_max``).
+    """
+
+    def get_backoff_time(self):
+        consecutive_errors = sum(
+            1 for _ in takewhile(lambda entry: entry.redirect_location is None, reversed(self.history))
+        )
+        if consecutive_errors == 0:
+            return 0
+        backoff = self.backoff_factor * (2 ** (consecutive_errors - 1))
+        if self.backoff_jitter:
+            backoff += random.random() * self.backoff_jitter
+        return float(max(0, min(self.backoff_max, backoff)))
+
+
+def _build_retry(retries, backoff_seconds):
+    """Retry policy allowing ``retries`` attempts in total for one GET.
+
+    Waits ``backoff_seconds`` before the first retry and doubles the wait
+    for every further one (see ``_FetchRetry``).
+    """
+    attempts_left = max(0, int(retries) - 1)
+    return _FetchRetry(
+        total=None,
+        connect=attempts_left,
+        read=attempts_left,
+        status=attempts_left,
+        other=attempts_left,
+        redirect=5,
+        backoff_factor=backoff_seconds,
+        backoff_max=RETRY_BACKOFF_MAX,
+        backoff_jitter=backoff_seconds,
+        status_forcelist=RETRY_HTTP_STATUSES,
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+
+
+def _http_get(url, timeout, retries=None):
+    """GET ``url`` through the shared pool and fail on HTTP error statuses."""
+    response = HTTP_POOL.request("GET", url, timeout=timeout, retries=retries)
+    if response.status >= 400:
+        raise HttpStatusError(response.status, response.reason)
+    return response
+
+
+@lru_cache(maxsize=32)
+def _listing_url_parts(template, search_term):
+    """``template`` for ``search_term`` split around the page number.
+
+    Formatted once per (template, search term); pages only join the parts.
+    ``None`` if the page placeholder carries a conversion or format spec
+    (``{page_num:02d}``), which has to see the actual number.
+    """
+    if template.count("{page_num") != template.count("{page_num}"):
+        return None
+    marker = "\x00"
+    url = template.format(search_term=quote_plus(search_term or ""), page_num=marker)
+    return tuple(url.split(marker))
+
+
+def listing_page_url(search_term, page_num):
+    parts = _listing_url_parts(BASE_URL_TEMPLATE, search_term)
+    if parts is None:
+        return BASE_URL_TEMPLATE.format(
+            search_term=quote_plus(search_term or ""), page_num=page_num
+        )
+    return str(page_num).join(parts)
+
+
 def fetch_listing_page(search_term, page_num, retries=3, backoff_seconds=2):
-    encoded_term = quote_plus(search_term or "")
-    url = BASE_URL_TEMPLATE.format(search_term=encoded_term, page_num=page_num)
-    headers = {"User-Agent": "Mozilla/5.0 (compatible; reklama5-scraper/1.0)"}
-    req = urllib_request.Request(url, headers=headers)
+    url = listing_page_url(search_term, page_num)
+    try:
+        response = _http_get(
+            url, timeout=LISTING_PAGE_TIMEOUT, retries=_build_retry(retries, backoff_seconds)
+        )
+    except urllib3.exceptions.HTTPError as exc:
+        print(
+            "⚠️  Ergebnisseite konnte nicht geladen werden | "
+            f"{shorten_url(url)} ({exc})"
+        )
+        return None
+    charset = _response_charset(response)
+    # UTF-8 bodies go to the parser as raw bytes so lxml decodes them
+    # natively; only foreign charsets are decoded here.
+    if charset.lower().replace("_", "-") in {"utf-8", "utf8"}:
+        return response.data
+    return response.data.decode(charset, errors="replace")
+
+def _has_class(*names):
+    """XPath predicate matching elements whose class list contains all ``names``."""
+    return " and ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')" for name in names
+    )
+
+
+# Compiled once at import so parsing a page does no selector work per call.
+# Class tests match whole tokens, like the CSS ``.class`` selectors they replace.
+_XP_AD_ROWS      = etree.XPath(f"//div[{_has_class('row', 'ad-top-div')}]")
+# Parents of the col-5 label cells; their children are paired in one pass.
+_XP_DETAIL_LABEL_PARENTS = etree.XPath(
+    f"//div[{_has_class('row', 'mt-3')}]//div[{_has_class('col-5')}]/.."
+)
+
+# Container classes whose <p> children may hold the spec line, in the order
+# they are tried. Plain <p> elements anywhere in the ad are the last resort.
+SPEC_CONTAINER_CLASSES = ("search-ad-info", "searchAdInfo", "ad-info", "ad-desc-div")
+DATE_CONTAINER_CLASSES = ("ad-date-div-1", "ad-date-div-2", "ad-date-div-3")
+_LISTING_CONTAINER_CLASSES = frozenset(SPEC_CONTAINER_CLASSES + DATE_CONTAINER_CLASSES)
+
+
+# lxml parsers must not be used by two threads at once, and detail pages are
+# parsed in the worker threads, so every thread keeps its own parsers.
+_thread_parsers = threading.local()
+
+
+def _html_parser(encoding=None):
+    """This thread's HTML parser for ``encoding`` (``None``: str input / sniffing).
+
+    ``collect_ids=False`` skips the id hash table nobody queries, and
+    whitespace-only text is dropped since ``_element_text`` ignores it anyway.
+    """
+    parsers = getattr(_thread_parsers, "by_encoding", None)
+    if parsers is None:
+        parsers = _thread_parsers.by_encoding = {}
+    parser = parsers.get(encoding)
+    if parser is None:
+        parser = parsers[encoding] = lxml_html.HTMLParser(
+            encoding=encoding, collect_ids=False, remove_blank_text=True
+        )
+    return parser
+
+
+def _parse_html_document(html, encoding=None):
+    """Build an lxml tree from ``str`` or raw ``bytes``; ``None`` for empty input."""
+    if isinstance(html, bytes):
+        parser = _html_parser(encoding or None)
+        source = html
+    else:
+        parser = _html_parser()
+        source = html or ""
+    if not source.strip():
+        return None
+    try:
+        return lxml_html.document_fromstring(source, parser=parser)
+    except etree.ParserError:
+        return None
+
+
+def _element_text(element, separator=""):
+    """Stripped text of ``element`` and its descendants, joined by ``separator``."""
+    return separator.join(
+        part for part in (text.strip() for text in element.itertext()) if part
+    )
+
+
+def _scan_listing(listing):
+    """Collect the elements of one ad in a single walk over its subtree.
+
+    Returns a dict with the title link, price, description, date, city and
+    promoted elements (``None`` when absent) plus ``spec_candidates``: one
+    list of <p> elements per entry in ``SPEC_CONTAINER_CLASSES`` and a final
+    list with every <p> of the ad, each in document order.
+    """
+    found = {
+        "link": None,
+        "price": None,
+        "desc": None,
+        "city": None,
+        "promoted": None,
+    }
+    date_elems = [None] * len(DATE_CONTAINER_CLASSES)
+    spec_candidates = [[] for _ in range(len(SPEC_CONTAINER_CLASSES) + 1)]
+
+    # (element, parent tag, container classes of the enclosing divs)
+    stack = [(child, listing.tag, frozenset()) for child in reversed(listing)]
+    while stack:
+        element, parent_tag, containers = stack.pop()
+        tag = element.tag
+        if not isinstance(tag, str):
+            continue
+        class_attr = element.get("class")
+        classes = class_attr.split() if class_attr else ()
+
+        if tag == "a":
+            if found["link"] is None and parent_tag == "h3" and "SearchAdTitle" in classes:
+                found["link"] = element
+        elif tag == "span":
+            if found["price"] is None and "search-ad-price" in classes:
+                found["price"] = element
+            if found["city"] is None and "city-span" in classes:
+                found["city"] = element
+            if containers:
+                for index, name in enumerate(DATE_CONTAINER_CLASSES):
+                    if date_elems[index] is None and name in containers:
+                        date_elems[index] = element
+        elif tag == "p":
+            if found["desc"] is None and "ad-desc-div" in containers:
+                found["desc"] = element
+            if containers:
+                for index, name in enumerate(SPEC_CONTAINER_CLASSES):
+                    if name in containers:
+                        spec_candidates[index].append(element)
+            spec_candidates[-1].append(element)
+        elif tag == "div":
+            if found["promoted"] is None and "promotedBtn" in classes:
+                found["promoted"] = element
+            relevant = _LISTING_CONTAINER_CLASSES.intersection(classes)
+            if relevant:
+                containers = containers | relevant
+
+        if len(element):
+            stack.extend((child, tag, containers) for child in reversed(element))
+
+    found["date"] = next((elem for elem in date_elems if elem is not None), None)
+    found["spec_candidates"] = spec_candidates
+    return found
+
+
+def _select_spec_line(spec_candidates):
+    seen = {}
+    for candidates in spec_candidates:
+        for elem in candidates:
+            text = seen.get(elem)
+            if text is None:
+                text = seen[elem] = _element_text(elem, " ")
+            if looks_like_spec_line(text):
+                return text
+    return None
 
-    for attempt in range(1, retries + 1):
-        try:
-            with urllib_request.urlopen(req, timeout=20) as response:
-                html_bytes = response.read()
-                charset = response.headers.get_content_charset() or "utf-8"
-            return html_bytes.decode(charset, errors="replace")
-        except (urllib_error.URLError, socket.timeout) as exc:
-            print(
-                "⚠️  Ergebnisseite konnte nicht geladen werden | "
-                f"{shorten_url(url)} (Versuch {attempt}/{retries}: {exc})"
-            )
-            if attempt >= retries:
-                return None
-            time.sleep(backoff_seconds * attempt)
 
 def parse_listing(html):
-    soup     = BeautifulSoup(html, "html.parser")
+    if isinstance(html, bytes):
+        document = _parse_html_document(html, encoding="utf-8")
+    else:
+        document = _parse_html_document(html)
+    if document is None:
+        return []
     results  = []
-    listings = soup.select("div.row.ad-top-div")
+    listings = _XP_AD_ROWS(document)
+    now      = datetime.now()
     for listing in listings:
-        link_elem     = listing.select_one("h3 > a.SearchAdTitle")
-        if not link_elem:
+        found         = _scan_listing(listing)
+        link_elem     = found["link"]
+        if link_elem is None:
             continue
         href          = link_elem.get("href", "")
-        m_id          = re.search(r"ad=(\d+)", href)
+        m_id          = RE_AD_ID.search(href)
         ad_id         = m_id.group(1) if m_id else None
         if ad_id:
             full_link = f"https://www.reklama5.mk/AdDetails?ad={ad_id}"
@@ -653,53 +1048,53 @@ def parse_listing(html):
             full_link = f"https://www.reklama5.mk{href}" if href else None
 
         title_elem    = link_elem
-        price_elem    = listing.select_one("span.search-ad-price")
-        desc_elem     = listing.select_one("div.ad-desc-div p")
-        date_elem     = (
-            listing.select_one("div.ad-date-div-1 span") or
-            listing.select_one("div.ad-date-div-2 span") or
-            listing.select_one("div.ad-date-div-3 span")
-        )
-        city_elem     = listing.select_one("span.city-span")
-        promoted_elem = listing.select_one("div.promotedBtn")
-
-        title       = title_elem.get_text(strip=True)
-        price_text  = price_elem.get_text(strip=True) if price_elem else None
-        desc_text   = desc_elem.get_text(strip=True) if desc_elem else ""
-        date_text   = date_elem.get_text(strip=True) if date_elem else None
-        parsed_date = parse_mk_date(date_text) if date_text else None
+        price_elem    = found["price"]
+        desc_elem     = found["desc"]
+        date_elem     = found["date"]
+        city_elem     = found["city"]
+        promoted_elem = found["promoted"]
+
+        title       = _element_text(title_elem)
+        price_text  = _element_text(price_elem) if price_elem is not None else None
+        desc_text   = _element_text(desc_elem) if desc_elem is not None else ""
+        date_text   = _element_text(date_elem) if date_elem is not None else None
+        parsed_date = parse_mk_date(date_text, now) if date_text else None
         if parsed_date:
             date_text = parsed_date.strftime("%Y-%m-%d %H:%M")
-        city_text   = city_elem.get_text(strip=True) if city_elem else None
-        is_promoted = bool(promoted_elem)
+        city_text   = _element_text(city_elem) if city_elem is not None else None
+        is_promoted = promoted_elem is not None
 
         make, model, year = extract_details(title)
         price = clean_price(price_text) if price_text else None
 
-        spec_text = extract_spec_line(listing)
+        spec_text = _select_spec_line(found["spec_candidates"])
         spec_year, km, kw, ps = parse_spec_line(spec_text)
 
         if spec_year is not None:
             year = spec_year
         elif year is None:
-            m_year = re.search(r"(\b19|20)\d{2}\b", desc_text)
+            m_year = RE_DESC_YEAR.search(desc_text)
             if m_year:
                 year = int(m_year.group(0))
 
-        if km is None:
-            m_km = re.search(r"(\d{1,3}(?:[\.,]\d{3})*|\d+)\s*km", desc_text, re.IGNORECASE)
+        # Most descriptions mention none of the units; a substring check on
+        # the lowered text decides whether the matching pattern runs at all.
+        desc_lower = desc_text.lower() if desc_text else ""
+
+        if km is None and "km" in desc_lower:
+            m_km = RE_KM_DESC.search(desc_text)
             if m_km:
                 km = int(m_km.group(1).replace(".","").replace(",",""))
 
-        if kw is None:
-            m_kw = re.search(r"(\d+)\s*kW", desc_text, re.IGNORECASE)
+        if kw is None and "kw" in desc_lower:
+            m_kw = RE_KW_DESC.search(desc_text)
             if m_kw:
                 kw = int(m_kw.group(1))
 
-        if ps is None:
-            m_ps = re.search(r"\((\d+)\s*Hp\)", desc_text, re.IGNORECASE)
+        if ps is None and "hp" in desc_lower:
+            m_ps = RE_PS_PAREN.search(desc_text)
             if not m_ps:
-                m_ps = re.search(r"(\d+)\s*HP", desc_text, re.IGNORECASE)
+                m_ps = RE_PS_BARE.search(desc_text)
             if m_ps:
                 ps = int(m_ps.group(1))
 
@@ -731,7 +1126,7 @@ def extract_details(title):
     make  = parts[0] if parts else None
     model = " ".join(parts[1:]) if len(parts) > 1 else None
     year  = None
-    m = re.search(r"\b(19|20)\d{2}\b", title)
+    m = RE_YEAR.search(title)
     if m:
         try:
             year = int(m.group(0))
@@ -740,57 +1135,131 @@ def extract_details(title):
     return make, model, year
 
 def extract_spec_line(listing):
-    candidate_selectors = [
-        "div.search-ad-info p",
-        "div.searchAdInfo p",
-        "div.ad-info p",
-        "div.ad-desc-div p",
-        "p"
-    ]
-    for selector in candidate_selectors:
-        for elem in listing.select(selector):
-            text = elem.get_text(" ", strip=True)
-            if looks_like_spec_line(text):
-                return text
-    return None
+    return _select_spec_line(_scan_listing(listing)["spec_candidates"])
 
 def looks_like_spec_line(text):
     if not text:
         return False
     lowered = text.lower()
-    has_year = bool(re.search(r"\b(19|20)\d{2}\b", text))
+    has_year = bool(RE_YEAR.search(text))
     has_km   = "km" in lowered or "км" in lowered
     has_kw   = "kw" in lowered or "кв" in lowered
     has_ps   = "hp" in lowered or "кс" in lowered
     return has_year and (has_km or has_kw or has_ps)
 
+def _collapse_whitespace(text):
+    """Same result as ``re.sub(r"\\s+", " ", text)``, without the regex engine."""
+    collapsed = " ".join(text.split())
+    if not collapsed:
+        return " " if text else ""
+    # split() drops the edges, the regex kept one space there.
+    if text[0].isspace():
+        collapsed = " " + collapsed
+    if text[-1].isspace():
+        collapsed += " "
+    return collapsed
+
+
 def parse_spec_line(text):
     if not text:
         return None, None, None, None
-    normalized = re.sub(r"\s+", " ", text)
-    year = extract_first_int(normalized, r"\b((?:19|20)\d{2})\b")
-    km   = extract_first_int(normalized, r"([\d\.\,\s]+)\s*(?:km|км)")
-    kw   = extract_first_int(normalized, r"([\d\.\,\s]+)\s*(?:kW|кW|кв)")
-    ps   = extract_first_int(normalized, r"\((\d+)\s*(?:Hp|HP|кс)\)")
+    normalized = _collapse_whitespace(text)
+    # The unit labels are plain substrings; only run a pattern whose label is
+    # actually present. The fields keep separate searches on purpose: a fused
+    # alternation would pick different first matches (e.g. when the year sits
+    # directly in front of the mileage).
+    lowered = normalized.lower()
+    year = extract_first_int(normalized, RE_SPEC_YEAR)
+    km   = (
+        extract_first_int(normalized, RE_SPEC_KM)
+        if "km" in lowered or "км" in lowered else None
+    )
+    kw   = (
+        extract_first_int(normalized, RE_SPEC_KW)
+        if "kw" in lowered or "кw" in lowered or "кв" in lowered else None
+    )
+    ps   = extract_first_int(normalized, RE_SPEC_PS) if "(" in normalized else None
     return year, km, kw, ps
 
 
-def _detail_worker(link, delay_range=None, rate_limit_semaphore=None):
+def _detail_worker(link, delay_range=None, rate_limit_semaphore=None, rate_limiter=None):
     if not link:
         if delay_range:
             time.sleep(random.uniform(*delay_range))
         return {}
 
+    # Pacing (shared limiter or the per-worker pause) happens outside the
+    # permit, so a waiting worker does not hold back the others.
+    if rate_limiter is not None:
+        rate_limiter.acquire()
     if rate_limit_semaphore is not None:
         rate_limit_semaphore.acquire()
     try:
         details = fetch_detail_attributes(link) or {}
-        if delay_range:
-            time.sleep(random.uniform(*delay_range))
-        return details
     finally:
         if rate_limit_semaphore is not None:
             rate_limit_semaphore.release()
+    if delay_range:
+        time.sleep(random.uniform(*delay_range))
+    return details
+
+
+class TokenBucket:
+    """Thread-safe rate limiter: ``rate`` tokens per second, ``capacity`` at most.
+
+    Time spent elsewhere (slow responses, parsing, detail pages) refills the
+    bucket, so callers only wait when they run ahead of ``rate``.
+    """
+
+    def __init__(self, rate, capacity=1):
+        if rate <= 0:
+            raise ValueError("rate muss größer als 0 sein")
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, cancel_event=None):
+        """Take one token, waiting as needed; ``False`` if cancelled meanwhile."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if cancel_event is None:
+                time.sleep(wait)
+            elif cancel_event.wait(wait):
+                return False
+
+
+def _detail_rate_limiter(delay_range):
+    """Shared pacing for all detail workers: one request per mean ``delay_range``.
+
+    The requests are spaced evenly without a burst, however many workers
+    run. Returns ``None`` when no pause is configured.
+    """
+    if not delay_range:
+        return None
+    mean_delay = (delay_range[0] + delay_range[1]) / 2
+    if mean_delay <= 0:
+        return None
+    return TokenBucket(1 / mean_delay, capacity=1)
+
+
+def _prefetch_listing_page(search_term, page_num, rate_limiter=None, cancel_event=None):
+    """Wait for the rate limiter, then fetch ``page_num`` unless the run ended meanwhile."""
+    if rate_limiter is not None and not rate_limiter.acquire(cancel_event):
+        return None
+    if cancel_event is not None and cancel_event.is_set():
+        return None
+    return fetch_listing_page(search_term, page_num)
 
 
 def enrich_listings_with_details(
@@ -801,7 +1270,16 @@ def enrich_listings_with_details(
     progress_callback=None,
     max_workers=3,
     rate_limit_permits=None,
+    executor=None,
+    rate_limiter=None,
 ):
+    """Merge detail-page attributes into ``listings`` in place.
+
+    ``executor`` lets the caller keep one worker pool for a whole run instead
+    of starting fresh threads for every result page; it is not shut down here.
+    ``rate_limiter`` (a shared ``TokenBucket``) paces the requests of all
+    workers together; ``delay_range`` is the older per-worker pause.
+    """
     if not enabled or not listings:
         return
 
@@ -820,8 +1298,12 @@ def enrich_listings_with_details(
     if total_to_process <= 0:
         return
 
-    iterator = islice(iter(listings), total_to_process)
-    target_listings = list(iterator)
+    # The listing dicts are updated in place either way; only a partial run
+    # needs its own (shorter) list.
+    if total_to_process == total_available:
+        target_listings = listings
+    else:
+        target_listings = listings[:total_to_process]
 
     worker_count = max(1, int(max_workers or 1))
     rate_limit_semaphore = None
@@ -829,71 +1311,94 @@ def enrich_listings_with_details(
         permits = max(1, min(int(rate_limit_permits), worker_count))
         rate_limit_semaphore = threading.Semaphore(permits)
 
+    owns_executor = executor is None
+    if owns_executor:
+        executor = ThreadPoolExecutor(max_workers=worker_count)
     futures = {}
-    with ThreadPoolExecutor(max_workers=worker_count) as executor:
-        for idx, listing in enumerate(target_listings):
-            link = listing.get("link")
+    try:
+        for listing in target_listings:
             future = executor.submit(
                 _detail_worker,
-                link,
+                listing.get("link"),
                 delay_range=delay_range,
                 rate_limit_semaphore=rate_limit_semaphore,
+                rate_limiter=rate_limiter,
             )
-            futures[future] = idx
+            futures[future] = listing
 
-        results = {}
+        # Merge each result as soon as it arrives instead of collecting all
+        # detail dicts first; every future maps to its own listing, so the
+        # completion order does not matter.
         for future in as_completed(futures):
-            idx = futures[future]
+            # Dropping consumed entries lets finished futures (and their
+            # result dicts) be freed while the rest are still running.
+            listing = futures.pop(future)
             try:
-                results[idx] = future.result() or {}
+                details = future.result() or {}
             except Exception:
-                results[idx] = {}
+                details = {}
+            for key, value in details.items():
+                if value in (None, ""):
+                    continue
+                listing[key] = value
             if progress_callback:
                 progress_callback()
+    finally:
+        if owns_executor:
+            executor.shutdown(wait=True)
 
-    for idx in range(len(target_listings)):
-        details = results.get(idx)
-        if not details:
-            continue
-        listing = target_listings[idx]
-        for key, value in details.items():
-            if value in (None, ""):
-                continue
-            listing[key] = value
+
+def _normalize_hash_value(value):
+    """One field as ``_normalize_listing_payload_for_hash`` stores it."""
+    if isinstance(value, str):
+        return value.strip() or None
+    if value is True or value is False:
+        return int(value)
+    return value
 
 
 def _normalize_listing_payload_for_hash(listing):
-    normalized = {}
-    for name in CSV_FIELDNAMES:
-        value = listing.get(name)
-        if isinstance(value, bool):
-            value = int(value)
-        if isinstance(value, str):
-            stripped = value.strip()
-            value = stripped or None
-        if name == "id" and value is not None:
-            value = str(value)
-        normalized[name] = value
+    # Stays a dict keyed by CSV_FIELDNAMES: the stored hashes are computed
+    # from exactly this mapping (see sqlite_store.calculate_listing_hash).
+    normalized = {
+        name: _normalize_hash_value(value)
+        for name, value in zip(CSV_FIELDNAMES, _csv_row(listing))
+    }
+    if normalized["id"] is not None:
+        normalized["id"] = str(normalized["id"])
     return normalized
 
 
+@lru_cache(maxsize=4096)
+def _fromisoformat_or_none(text):
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
 def _parse_iso_datetime(value):
     if value in (None, ""):
         return None
     if isinstance(value, datetime):
         return value
-    try:
-        return datetime.fromisoformat(str(value))
-    except ValueError:
-        return None
+    return _fromisoformat_or_none(str(value))
 
 
 def _dates_equivalent(old_value, new_value):
+    # Unchanged listings repeat the stored text verbatim; only differing
+    # values need parsing.
+    if old_value == new_value:
+        return True
     old_dt = _parse_iso_datetime(old_value)
     new_dt = _parse_iso_datetime(new_value)
     if old_dt and new_dt:
-        return abs((new_dt - old_dt).total_seconds()) <= DATE_COMPARISON_TOLERANCE.total_seconds()
-    return old_value == new_value
+        return abs((new_dt - old_dt).total_seconds()) <= DATE_COMPARISON_TOLERANCE_SECONDS
+    return False
+
+
+# Per-field equality used by classify_listing_status; other fields compare with ==.
+_FIELD_EQUALITY = {"date": _dates_equivalent}
 
 
 def classify_listing_status(listings, db_connection, developer_logger=None):
@@ -918,16 +1423,15 @@ def classify_listing_status(listings, db_connection, developer_logger=None):
             db_connection, normalized_ids_to_fetch
         )
 
-    fallback_counter = 0
     total_items = len(listings)
-    for idx, listing in enumerate(listings):
-        fallback_counter += 1
-        normalized_id = normalized_ids_per_listing[idx]
+    for fallback_counter, (listing, normalized_id) in enumerate(
+        zip(listings, normalized_ids_per_listing), 1
+    ):
+        # Also the id shown in developer log lines.
         cache_key = normalized_id or f"tmp-{fallback_counter}"
         listing_status = STATUS_NEW
         changes: Dict[str, Dict[str, object]] = {}
         use_database = db_connection is not None and normalized_id
-        display_id = normalized_id or f"tmp-{fallback_counter}"
 
         if developer_logger:
             if not normalized_id:
@@ -936,61 +1440,51 @@ def classify_listing_status(listings, db_connection, developer_logger=None):
                 )
             elif db_connection is None:
                 developer_logger(
-                    f"[DB] ({fallback_counter}/{total_items}) ID {display_id}: keine Datenbank – Status {STATUS_LABELS[STATUS_NEW]}"
+                    f"[DB] ({fallback_counter}/{total_items}) ID {cache_key}: keine Datenbank – Status {STATUS_LABELS[STATUS_NEW]}"
                 )
             else:
                 developer_logger(
-                    f"[DB] ({fallback_counter}/{total_items}) Suche ID {display_id} in der Datenbank"
+                    f"[DB] ({fallback_counter}/{total_items}) Suche ID {cache_key} in der Datenbank"
                 )
 
         existing = None
         if use_database:
-            normalized_payload = _normalize_listing_payload_for_hash(listing)
             existing = existing_rows.get(normalized_id)
             if existing is None:
                 listing_status = STATUS_NEW
             else:
-                fallback_fields = list(DETAIL_ONLY_FIELDS) + [
-                    "km",
-                    "kw",
-                    "ps",
-                    "year",
-                    "price",
-                    "city",
-                    "link",
-                ]
-                for detail_field in fallback_fields:
-                    new_value = normalized_payload.get(detail_field)
-                    if new_value in (None, ""):
-                        existing_value = existing.get(detail_field)
-                        if existing_value not in (None, ""):
-                            normalized_payload[detail_field] = existing_value
-
-                listing_hash = sqlite_store.calculate_listing_hash(normalized_payload)
-                existing_hash = existing.get("hash")
-
-                for field in STATUS_COMPARISON_FIELDS:
-                    new_value = normalized_payload.get(field)
-                    if new_value in (None, ""):
-                        continue
-                    old_value = existing.get(field)
-                    values_equal = (
-                        _dates_equivalent(old_value, new_value)
-                        if field == "date"
-                        else old_value == new_value
+                # Only the overview fields decide the status; the detail
+                # fallback and the hash are needed only for changed listings.
+                changes = {
+                    field: {"old": old_value, "new": new_value}
+                    for field, old_value, new_value in (
+                        (field, existing.get(field), _normalize_hash_value(listing.get(field)))
+                        for field in STATUS_COMPARISON_FIELDS
                     )
-                    if not values_equal:
-                        changes[field] = {"old": old_value, "new": new_value}
+                    if new_value not in (None, "")
+                    and not _FIELD_EQUALITY.get(field, eq)(old_value, new_value)
+                }
+
+                if changes:
+                    normalized_payload = _normalize_listing_payload_for_hash(listing)
+                    for detail_field in HASH_FALLBACK_FIELDS:
+                        new_value = normalized_payload.get(detail_field)
+                        if new_value in (None, ""):
+                            existing_value = existing.get(detail_field)
+                            if existing_value not in (None, ""):
+                                normalized_payload[detail_field] = existing_value
 
-                if changes and existing_hash != listing_hash:
-                    changes["hash"] = {"old": existing_hash, "new": listing_hash}
+                    listing_hash = sqlite_store.calculate_listing_hash(normalized_payload)
+                    existing_hash = existing.get("hash")
+                    if existing_hash != listing_hash:
+                        changes["hash"] = {"old": existing_hash, "new": listing_hash}
 
                 listing_status = STATUS_CHANGED if changes else STATUS_UNCHANGED
 
             if developer_logger:
                 if existing is None:
                     developer_logger(
-                        f"[DB] ({fallback_counter}/{total_items}) ID {display_id} nicht gefunden – Status {STATUS_LABELS[listing_status]}"
+                        f"[DB] ({fallback_counter}/{total_items}) ID {cache_key} nicht gefunden – Status {STATUS_LABELS[listing_status]}"
                     )
                 elif listing_status == STATUS_CHANGED:
                     changed_fields = [field for field in changes.keys() if field != "hash"]
@@ -998,11 +1492,11 @@ def classify_listing_status(listings, db_connection, developer_logger=None):
                         changed_fields.append("Hash")
                     field_list = ", ".join(changed_fields) if changed_fields else "-"
                     developer_logger(
-                        f"[DB] ({fallback_counter}/{total_items}) ID {display_id} geändert – Felder: {field_list}"
+                        f"[DB] ({fallback_counter}/{total_items}) ID {cache_key} geändert – Felder: {field_list}"
                     )
                 else:
                     developer_logger(
-                        f"[DB] ({fallback_counter}/{total_items}) ID {display_id} unverändert"
+                        f"[DB] ({fallback_counter}/{total_items}) ID {cache_key} unverändert"
                     )
 
         listing["_status"] = listing_status
@@ -1012,43 +1506,61 @@ def classify_listing_status(listings, db_connection, developer_logger=None):
 
 
 def fetch_detail_attributes(url, retries=3, backoff_seconds=2):
-    if not url:
+    if not url or url in _missing_detail_urls:
         return {}
 
-    headers = {"User-Agent": "Mozilla/5.0 (compatible; reklama5-scraper/1.0)"}
-    req = urllib_request.Request(url, headers=headers)
+    try:
+        response = _http_get(
+            url,
+            timeout=DETAIL_PAGE_TIMEOUT,
+            retries=_build_retry(retries, backoff_seconds),
+        )
+    except urllib3.exceptions.HTTPError as exc:
+        print(
+            "⚠️  Detailseite konnte nicht geladen werden | "
+            f"{shorten_url(url)} ({exc})"
+        )
+        if _is_gone_error(exc):
+            _missing_detail_urls.add(url)
+        return {}
+    return parse_detail_attributes(response.data, encoding=_response_charset(response))
 
-    for attempt in range(1, retries + 1):
-        try:
-            with urllib_request.urlopen(req, timeout=15) as response:
-                html = response.read()
-            break
-        except (urllib_error.URLError, socket.timeout) as exc:
-            print(
-                "⚠️  Detailseite konnte nicht geladen werden | "
-                f"{shorten_url(url)} (Versuch {attempt}/{retries}: {exc})"
-            )
-            if attempt >= retries:
-                return {}
-            time.sleep(backoff_seconds * attempt)
-    soup = BeautifulSoup(html, "html.parser")
+
+def parse_detail_attributes(html, encoding=None):
+    """Extract the labelled attribute table from a detail page."""
+    document = _parse_html_document(html, encoding=encoding)
+    if document is None:
+        return normalize_detail_values({})
     raw = {}
-    for label_div in soup.select("div.row.mt-3 div.col-5"):
-        label_text = label_div.get_text(strip=True)
-        if not label_text:
+    for label_div, value_div in _iter_detail_pairs(document):
+        label_text = _element_text(label_div)
+        if not label_text or label_text[0].lower() not in DETAIL_FIELD_FIRST_CHARS:
             continue
-        label_clean = label_text.strip().rstrip(":").lower()
-        key = DETAIL_FIELD_MAP.get(label_clean)
+        key = DETAIL_LABEL_LOOKUP.get(label_text)
+        if key is None:
+            key = DETAIL_FIELD_MAP.get(label_text.rstrip(":").lower())
         if not key:
             continue
-        value_div = label_div.find_next_sibling("div", class_="col-7")
-        if not value_div:
-            continue
-        value_text = value_div.get_text(strip=True)
-        raw[key] = value_text
+        raw[key] = _element_text(value_div)
     return normalize_detail_values(raw)
 
 
+def _iter_detail_pairs(document):
+    """Yield ``(col-5, col-7)`` sibling pairs; each label gets the next value cell."""
+    for parent in _XP_DETAIL_LABEL_PARENTS(document):
+        pending_labels = []
+        for child in parent:
+            if child.tag != "div":
+                continue
+            classes = (child.get("class") or "").split()
+            if "col-5" in classes:
+                pending_labels.append(child)
+            elif "col-7" in classes and pending_labels:
+                for label_div in pending_labels:
+                    yield label_div, child
+                pending_labels = []
+
+
 def normalize_detail_values(raw):
     result = {}
     for text_key in ("make", "model", "fuel", "gearbox", "body", "color",
@@ -1070,44 +1582,41 @@ def normalize_detail_values(raw):
 
 
 def parse_int_value(text):
-    digits = re.sub(r"[^0-9]", "", text)
-    if not digits:
-        return None
-    try:
-        return int(digits)
-    except ValueError:
-        return None
+    digits = text.translate(_DIGITS_ONLY)
+    return int(digits) if digits else None
 
 
 def parse_power_text(text):
     lowered = text.lower()
-    kw_match = re.search(r"(\d+)\s*(?:kw|кw|кв)", lowered)
-    ps_match = re.search(r"(\d+)\s*(?:ks|кс|hp)", lowered)
+    kw_match = RE_POWER_KW.search(lowered)
+    ps_match = RE_POWER_PS.search(lowered)
     kw_value = int(kw_match.group(1)) if kw_match else None
     ps_value = int(ps_match.group(1)) if ps_match else None
     return kw_value, ps_value
 
+@lru_cache(maxsize=64)
+def _compile_ignorecase(pattern):
+    return re.compile(pattern, re.IGNORECASE)
+
+
 def extract_first_int(text, pattern):
-    m = re.search(pattern, text, re.IGNORECASE)
+    if isinstance(pattern, str):
+        pattern = _compile_ignorecase(pattern)
+    m = pattern.search(text)
     if not m:
         return None
-    digits = re.sub(r"[^0-9]", "", m.group(1))
-    if not digits:
-        return None
-    try:
-        return int(digits)
-    except ValueError:
-        return None
+    digits = m.group(1).translate(_DIGITS_ONLY)
+    return int(digits) if digits else None
 
 def clean_price(price_text):
     if not price_text:
         return None
 
     text = price_text.replace("\xa0", " ").strip()
-    if re.search(r"(ПоДоговор|дог|nachVereinbarung|1€)", text, re.IGNORECASE):
+    if RE_PRICE_ON_REQUEST.search(text):
         return None
 
-    match = re.search(r"-?[\d\s\.,]+", text)
+    match = RE_PRICE_NUMBER.search(text)
     if not match:
         return None
 
@@ -1130,52 +1639,77 @@ def clean_price(price_text):
     value = int(integer_text)
     return -value if is_negative else value
 
-def parse_mk_date(date_text):
+@lru_cache(maxsize=4096)
+def _parse_iso_date_text(raw):
+    """``datetime`` for ISO text such as "2024-01-05 13:45", else ``None``.
+
+    Only the absolute format is cached; relative dates depend on the clock.
+    """
+    if len(raw) < 10 or raw[4] != "-" or not raw[:4].isdigit():
+        return None
+    try:
+        return datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+
+
+def _relative_day_time(txt, days_back, now):
+    """Resolve "вчера 08:30" / "денес 15:45" against the day of ``now``."""
+    parts = txt.split()
+    hour, minute = 0, 0
+    if len(parts) >= 2 and ":" in parts[1]:
+        try:
+            hour, minute = map(int, parts[1].split(":"))
+        except ValueError:
+            hour, minute = 0, 0
+    dt = now - timedelta(days=days_back)
+    return dt.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+
+@lru_cache(maxsize=4096)
+def _parse_mk_date_parts(raw):
+    """``(month, day, hour, minute)`` for text such as "31 дек 23:45", else ``None``.
+
+    The year is resolved by the caller because it depends on the clock.
+    """
+    parts = raw.split()
+    if len(parts) < 3:
+        return None
+    try:
+        day = int(parts[0])
+        hour, minute = map(int, parts[2].split(":"))
+    except ValueError:
+        return None
+    month = MK_MONTHS.get(parts[1].lower())
+    if not month:
+        return None
+    return month, day, hour, minute
+
+
+def parse_mk_date(date_text, now=None):
+    """Parse a listing date; ``now`` (default: current time) anchors relative
+    dates and the missing year, so callers can pass one value per page."""
     if not date_text:
         return None
     raw = date_text.strip()
-    txt = raw.lower()
 
     # Bereits normalisierte Datumsstrings (z. B. "2024-01-05 13:45") unterstützen.
-    for candidate in (raw, raw.replace("T", " ")):
-        try:
-            return datetime.fromisoformat(candidate)
-        except ValueError:
-            pass
+    iso_value = _parse_iso_date_text(raw)
+    if iso_value is not None:
+        return iso_value
 
+    if now is None:
+        now = datetime.now()
+    txt = raw.lower()
     if txt.startswith("вчера"):
-        parts = txt.split()
-        hour, minute = 0, 0
-        if len(parts) >= 2 and ":" in parts[1]:
-            try:
-                hour, minute = map(int, parts[1].split(":"))
-            except:
-                hour, minute = 0, 0
-        dt = datetime.now() - timedelta(days=1)
-        dt = dt.replace(hour=hour, minute=minute, second=0, microsecond=0)
-        return dt
+        return _relative_day_time(txt, 1, now)
     if txt.startswith("денес"):
-        parts = txt.split()
-        hour, minute = 0, 0
-        if len(parts) >= 2 and ":" in parts[1]:
-            try:
-                hour, minute = map(int, parts[1].split(":"))
-            except:
-                hour, minute = 0, 0
-        dt = datetime.now().replace(hour=hour, minute=minute, second=0, microsecond=0)
-        return dt
-    parts = date_text.split()
-    if len(parts) < 3:
+        return _relative_day_time(txt, 0, now)
+    date_parts = _parse_mk_date_parts(raw)
+    if date_parts is None:
         return None
+    month, day, hour, minute = date_parts
     try:
-        day       = int(parts[0])
-        month_txt = parts[1].lower()
-        time_txt  = parts[2]
-        hour, minute = map(int, time_txt.split(":"))
-        month     = MK_MONTHS.get(month_txt)
-        if not month:
-            return None
-        now = datetime.now()
         year = now.year
         dt = datetime(year, month, day, hour, minute)
         # Anzeigen enthalten kein Jahr. Fällt der Monat/Tag in die Zukunft,
@@ -1186,21 +1720,25 @@ def parse_mk_date(date_text):
     except Exception:
         return None
 
-def is_within_days(date_text, days, promoted):
-    dt = parse_mk_date(date_text)
+def is_within_days(date_text, days, promoted, *, now=None):
+    if now is None:
+        now = datetime.now()
+    dt = parse_mk_date(date_text, now)
     if dt is None:
         return False
     if promoted:
         return False
-    return dt >= datetime.now() - timedelta(days=days)
+    return dt >= now - timedelta(days=days)
 
-def is_older_than_days(date_text, days, promoted):
-    dt = parse_mk_date(date_text)
+def is_older_than_days(date_text, days, promoted, *, now=None):
+    if now is None:
+        now = datetime.now()
+    dt = parse_mk_date(date_text, now)
     if dt is None:
         return False
     if promoted:
         return False
-    return dt < datetime.now() - timedelta(days=days)
+    return dt < now - timedelta(days=days)
 
 def save_raw_filtered(
     rows,
@@ -1212,36 +1750,38 @@ def save_raw_filtered(
     db_connection=None,
 ):
     saved_rows = []
+    now = None if pre_filtered else datetime.now()
     for r in rows:
         if limit is not None and len(saved_rows) >= limit:
             break
-        if pre_filtered:
-            saved_rows.append(r)
-            continue
-        if r["date"] and is_within_days(r["date"], days, r["promoted"]):
+        if pre_filtered or is_within_days(r["date"], days, r["promoted"], now=now):
             saved_rows.append(r)
 
     if not saved_rows:
         return 0
 
-    sanitized_rows = [
-        {name: row.get(name) for name in CSV_FIELDNAMES}
-        for row in saved_rows
-    ]
-
     if db_connection is not None:
-        sqlite_store.upsert_many(db_connection, sanitized_rows, DB_FIELDNAMES)
+        # upsert_many reads only DB_FIELDNAMES from each row, so the rows are
+        # handed over as they are instead of being copied field by field.
+        sqlite_store.upsert_many(db_connection, saved_rows, DB_FIELDNAMES)
         return len(saved_rows)
 
     target_csv = csv_filename or OUTPUT_CSV
     file_exists = os.path.isfile(target_csv)
     with open(target_csv, mode="a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
+        writer = csv.writer(f)
         if not file_exists:
-            writer.writeheader()
-        writer.writerows(sanitized_rows)
+            writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(map(_csv_row, saved_rows))
     return len(saved_rows)
 
+
+def _csv_row(row):
+    try:
+        return CSV_ROW_GETTER(row)
+    except KeyError:
+        return tuple(row.get(name) for name in CSV_FIELDNAMES)
+
 def aggregate_data(
     csv_filename=None,
     output_json=None,
@@ -1259,7 +1799,7 @@ def aggregate_data(
         close_after = False
         conn = db_connection
         if conn is None and db_path:
-            conn = sqlite_store.open_database(db_path)
+            conn = sqlite_store.open_database(db_path, read_only=True)
             close_after = True
         try:
             stats = sqlite_store.fetch_make_model_stats(
@@ -1268,21 +1808,21 @@ def aggregate_data(
                 days=days,
                 search=search_term,
             )
-            agg = defaultdict(lambda: {"count_total": 0, "count_with_price": 0, "sum": 0})
+            # Buckets are [count_total, count_with_price, sum_price].
+            agg = {}
             for (make, model, _fuel), values in stats.items():
                 key = f"{make} {model}".strip()
-                bucket = agg[key]
-                bucket["count_total"] += values["count_total"]
-                bucket["count_with_price"] += values["count_for_avg"]
-                bucket["sum"] += values["sum"]
-            for key, val in agg.items():
-                avg = None
-                if val["count_with_price"] > 0:
-                    avg = val["sum"] / val["count_with_price"]
+                bucket = agg.get(key)
+                if bucket is None:
+                    bucket = agg[key] = [0, 0, 0]
+                bucket[0] += values["count_total"]
+                bucket[1] += values["count_for_avg"]
+                bucket[2] += values["sum"]
+            for key, (count_total, count_with_price, sum_price) in agg.items():
                 result[key] = {
-                    "count_total": val["count_total"],
-                    "count_with_price": val["count_with_price"],
-                    "avg_price": avg,
+                    "count_total": count_total,
+                    "count_with_price": count_with_price,
+                    "avg_price": sum_price / count_with_price if count_with_price > 0 else None,
                 }
         finally:
             if close_after and conn is not None:
@@ -1295,38 +1835,47 @@ def aggregate_data(
                 f"⚠️  Datei „{csv_filename}“ wurde nicht gefunden. Keine Aggregation möglich."
             )
             return {}
-        agg = defaultdict(
-            lambda: {"count_total": 0, "count_with_price": 0, "sum_price": 0}
-        )
-        with open(csv_filename, mode="r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                make = row["make"]
-                model = row["model"]
-                price_txt = row.get("price")
-                price = None
-                if price_txt not in (None, ""):
-                    try:
-                        price = int(str(price_txt).strip())
-                    except ValueError:
-                        price = None
-                key = f"{make} {model}"
-                agg[key]["count_total"] += 1
-                if price is not None:
-                    agg[key]["count_with_price"] += 1
-                    agg[key]["sum_price"] += price
-        for key, val in agg.items():
-            avg = None
-            if val["count_with_price"] > 0:
-                avg = val["sum_price"] / val["count_with_price"]
+        # Buckets are [count_total, count_with_price, sum_price].
+        agg = {}
+        with open(csv_filename, mode="r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header:
+                # Read columns by position; only the three aggregated fields are
+                # touched, no per-row dict is built.
+                make_idx = header.index("make")
+                model_idx = header.index("model")
+                price_idx = header.index("price") if "price" in header else None
+                width = len(header)
+                for row in reader:
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        row = row + [None] * (width - len(row))
+                    price_txt = row[price_idx] if price_idx is not None else None
+                    price = None
+                    if price_txt:
+                        try:
+                            price = int(price_txt.strip())
+                        except ValueError:
+                            price = None
+                    key = f"{row[make_idx]} {row[model_idx]}"
+                    bucket = agg.get(key)
+                    if bucket is None:
+                        bucket = agg[key] = [0, 0, 0]
+                    bucket[0] += 1
+                    if price is not None:
+                        bucket[1] += 1
+                        bucket[2] += price
+        for key, (count_total, count_with_price, sum_price) in agg.items():
             result[key] = {
-                "count_total": val["count_total"],
-                "count_with_price": val["count_with_price"],
-                "avg_price": avg,
+                "count_total": count_total,
+                "count_with_price": count_with_price,
+                "avg_price": sum_price / count_with_price if count_with_price > 0 else None,
             }
 
     with open(output_json, mode="w", encoding="utf-8") as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+        f.write(_json_dumps(result))
     return result
 
 
@@ -1518,7 +2067,29 @@ def _analysis_settings_menu(
             print("⚠️  Ungültige Auswahl. Bitte erneut versuchen.")
 
 
-def analysis_menu(*, db_path):
+# Aggregates shown in the analysis menu, keyed by query and filters. The
+# database does not change while the menu is open, so re-opening a view with
+# the same filters reuses the result for a short while.
+ANALYSIS_CACHE_TTL_SECONDS = 60
+_analysis_stats_cache = {}
+
+
+def _cached_analysis_stats(key, loader, ttl=ANALYSIS_CACHE_TTL_SECONDS):
+    now = time.monotonic()
+    cached = _analysis_stats_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    result = loader()
+    _analysis_stats_cache[key] = (now + ttl, result)
+    return result
+
+
+def analysis_menu(*, db_path, conn=None):
+    """Interactive statistics menu.
+
+    ``conn`` lets a finished scrape run hand over its open connection (and
+    warm page cache); it stays owned by the caller and is not closed here.
+    """
     if not db_path:
         print("⚠️  Für Analysen muss eine SQLite-Datenbank angegeben werden.")
         return "exit"
@@ -1526,15 +2097,19 @@ def analysis_menu(*, db_path):
         print(f"\n⚠️  Datenbank „{db_path}“ nicht gefunden.")
         return "exit"
 
-    try:
-        conn = sqlite_store.open_database(db_path)
-    except Exception as exc:
-        print(f"⚠️  Konnte Datenbank nicht öffnen: {exc}")
-        return "exit"
+    owns_connection = conn is None
+    if owns_connection:
+        try:
+            conn = sqlite_store.open_database(db_path, read_only=True)
+        except Exception as exc:
+            print(f"⚠️  Konnte Datenbank nicht öffnen: {exc}")
+            return "exit"
 
     min_price_for_avg = DEFAULT_MIN_PRICE_FOR_AVG
     db_days_filter = None
     db_search_filter = None
+    # A scrape run may have written new rows since the menu was last open.
+    _analysis_stats_cache.clear()
     try:
         while True:
             print_section("📊 Analyse-Center")
@@ -1553,11 +2128,14 @@ def analysis_menu(*, db_path):
             choice = input("Deine Auswahl: ").strip()
             if choice == "1":
                 clear_screen()
-                stats = sqlite_store.fetch_make_model_stats(
-                    conn,
-                    min_price=min_price_for_avg,
-                    days=db_days_filter,
-                    search=db_search_filter,
+                stats = _cached_analysis_stats(
+                    ("make_model", db_path, min_price_for_avg, db_days_filter, db_search_filter),
+                    lambda: sqlite_store.fetch_make_model_stats(
+                        conn,
+                        min_price=min_price_for_avg,
+                        days=db_days_filter,
+                        search=db_search_filter,
+                    ),
                 )
                 display_make_model_summary(
                     stats, min_price_for_avg=min_price_for_avg
@@ -1565,11 +2143,14 @@ def analysis_menu(*, db_path):
                 display_recent_price_changes(conn)
             elif choice == "2":
                 clear_screen()
-                stats = sqlite_store.fetch_model_year_stats(
-                    conn,
-                    min_price=min_price_for_avg,
-                    days=db_days_filter,
-                    search=db_search_filter,
+                stats = _cached_analysis_stats(
+                    ("model_year", db_path, min_price_for_avg, db_days_filter, db_search_filter),
+                    lambda: sqlite_store.fetch_model_year_stats(
+                        conn,
+                        min_price=min_price_for_avg,
+                        days=db_days_filter,
+                        search=db_search_filter,
+                    ),
                 )
                 display_avg_price_by_model_year(
                     stats,
@@ -1593,7 +2174,8 @@ def analysis_menu(*, db_path):
             else:
                 print("⚠️  Ungültige Auswahl. Bitte erneut versuchen.")
     finally:
-        conn.close()
+        if owns_connection:
+            conn.close()
 
 
 def run_scraper_flow_from_config(config, *, interactive=True):
@@ -1615,12 +2197,32 @@ def run_scraper_flow_from_config(config, *, interactive=True):
         except Exception as exc:
             print("⚠️  SQLite konnte nicht initialisiert werden. Nutze CSV-Datei.")
             print(f"    Grund: {exc}")
+            if db_connection is not None:
+                db_connection.close()
             db_connection = None
             db_path = None
     if not db_path:
         csv_filename = config.csv_filename or OUTPUT_CSV
         if os.path.isfile(csv_filename):
             os.remove(csv_filename)
+
+    # One owner for the connection: the scrape loop, the summary, the
+    # aggregation and the analysis menu all use it, and it is closed here
+    # whichever of them returns or raises.
+    try:
+        return _run_scraper_session(
+            config,
+            interactive=interactive,
+            db_connection=db_connection,
+            db_path=db_path,
+            csv_filename=csv_filename,
+        )
+    finally:
+        if db_connection is not None:
+            db_connection.close()
+
+
+def _run_scraper_session(config, *, interactive, db_connection, db_path, csv_filename):
     search_term = config.search_term or ""
     try:
         days_value = int(config.days)
@@ -1665,9 +2267,6 @@ def run_scraper_flow_from_config(config, *, interactive=True):
     developer_logging_enabled = bool(getattr(config, "developer_logging", False))
     developer_logger = _build_developer_logger(developer_logging_enabled)
 
-    if csv_filename and os.path.isfile(csv_filename):
-        os.remove(csv_filename)
-
     if developer_logger:
         if db_connection is not None:
             developer_logger(f"Starte Lauf mit SQLite-Ziel {db_path}")
@@ -1690,11 +2289,36 @@ def run_scraper_flow_from_config(config, *, interactive=True):
     pages_viewed = 0
     detail_requests = 0
 
+    last_page = 200
+    detail_executor = None
+    detail_rate_limiter = None
+    if enable_detail_capture:
+        detail_executor = ThreadPoolExecutor(max_workers=detail_worker_count)
+        detail_rate_limiter = _detail_rate_limiter(detail_delay_range)
+    # The next result page is requested in the background while the current
+    # one is classified, enriched and saved.
+    page_executor = ThreadPoolExecutor(max_workers=1)
+    stop_prefetch = threading.Event()
+    page_rate_limiter = TokenBucket(LISTING_PAGE_RATE, capacity=LISTING_PAGE_BURST)
+    next_page_future = None
     try:
-        for page in range(1, 200):
-            if developer_logger:
-                developer_logger(f"Lade Seite {page:02d} für Suche '{search_term or 'alle'}'")
-            html = fetch_listing_page(search_term, page)
+        for page in range(1, last_page):
+            if next_page_future is None:
+                # Page 1, or a page that was not prefetched because the
+                # previous one could already have reached the limit.
+                if developer_logger:
+                    developer_logger(
+                        f"Lade Seite {page:02d} für Suche '{search_term or 'alle'}'"
+                    )
+                next_page_future = page_executor.submit(
+                    _prefetch_listing_page,
+                    search_term,
+                    page,
+                    rate_limiter=page_rate_limiter,
+                    cancel_event=stop_prefetch,
+                )
+            html = next_page_future.result()
+            next_page_future = None
             if not html:
                 print()
                 print(f"⚠️  Seite {page} konnte nicht geladen werden. Stop.")
@@ -1718,6 +2342,11 @@ def run_scraper_flow_from_config(config, *, interactive=True):
             skipped_promoted = 0
             skipped_missing_date = 0
             skipped_old = 0
+            # The stop criterion only ever fires for dated, non-promoted ads
+            # outside the window, so it is checked here instead of rescanning
+            # the page afterwards.
+            older_item = None
+            now = datetime.now()
             for item in listings:
                 promoted = bool(item.get("promoted"))
                 date_value = item.get("date")
@@ -1727,8 +2356,12 @@ def run_scraper_flow_from_config(config, *, interactive=True):
                 if not date_value:
                     skipped_missing_date += 1
                     continue
-                if not is_within_days(date_value, days, promoted):
+                if not is_within_days(date_value, days, promoted, now=now):
                     skipped_old += 1
+                    if older_item is None and is_older_than_days(
+                        date_value, days, promoted, now=now
+                    ):
+                        older_item = item
                     continue
                 eligible_listings.append(item)
             if developer_logger:
@@ -1749,18 +2382,27 @@ def run_scraper_flow_from_config(config, *, interactive=True):
                 developer_logger(
                     f"Seite {page:02d}: überprüfe {len(eligible_listings)} Anzeigen auf Duplikate"
                 )
-            for item in eligible_listings:
-                item_id = item.get("id")
-                if item_id and item_id in seen_ids:
-                    duplicates_skipped_page += 1
-                    if developer_logger:
-                        developer_logger(
-                            f"Seite {page:02d}: Anzeige {item_id} bereits verarbeitet – überspringe"
-                        )
-                    continue
-                if item_id:
-                    seen_ids.add(item_id)
-                deduplicated.append(item)
+            page_ids = [item.get("id") for item in eligible_listings]
+            present_ids = [item_id for item_id in page_ids if item_id]
+            new_ids = set(present_ids)
+            new_ids.difference_update(seen_ids)
+            if len(new_ids) == len(present_ids):
+                # Common case: nothing repeats, neither on the page nor from
+                # earlier pages, so the page is kept as is.
+                deduplicated = eligible_listings
+            else:
+                pending_ids = set(new_ids)
+                for item, item_id in zip(eligible_listings, page_ids):
+                    if item_id and item_id not in pending_ids:
+                        duplicates_skipped_page += 1
+                        if developer_logger:
+                            developer_logger(
+                                f"Seite {page:02d}: Anzeige {item_id} bereits verarbeitet – überspringe"
+                            )
+                        continue
+                    pending_ids.discard(item_id)
+                    deduplicated.append(item)
+            seen_ids |= new_ids
             eligible_listings = deduplicated
             duplicates_skipped_total += duplicates_skipped_page
             if developer_logger:
@@ -1786,13 +2428,34 @@ def run_scraper_flow_from_config(config, *, interactive=True):
                         f"Limit aktiv: prüfe nur noch {len(eligible_listings)} Einträge auf Seite {page:02d}"
                     )
 
+            # Only prefetch when this page cannot end the run through the limit;
+            # otherwise a run stopping at --limit would still request one more
+            # result page while the details are fetched.
+            if (
+                older_item is None
+                and page + 1 < last_page
+                and (limit is None or total_saved + len(eligible_listings) < limit)
+            ):
+                if developer_logger:
+                    developer_logger(
+                        f"Lade Seite {page + 1:02d} für Suche '{search_term or 'alle'}' im Hintergrund"
+                    )
+                next_page_future = page_executor.submit(
+                    _prefetch_listing_page,
+                    search_term,
+                    page + 1,
+                    rate_limiter=page_rate_limiter,
+                    cancel_event=stop_prefetch,
+                )
+
             found_on_page = len(eligible_listings)
             total_found += found_on_page
 
-            print(f"Lade Seite {page:02d} ({found_on_page:02d} Treffer)")
+            page_lines = [f"Lade Seite {page:02d} ({found_on_page:02d} Treffer)"]
             if duplicates_skipped_page:
-                print(f"↺ {duplicates_skipped_page} Duplikate übersprungen")
-            print(INLINE_PROGRESS_SYMBOL * found_on_page)
+                page_lines.append(f"↺ {duplicates_skipped_page} Duplikate übersprungen")
+            page_lines.append(INLINE_PROGRESS_SYMBOL * found_on_page)
+            print_lines(page_lines)
 
             classify_listing_status(
                 eligible_listings,
@@ -1825,18 +2488,19 @@ def run_scraper_flow_from_config(config, *, interactive=True):
             if skip_unchanged:
                 skipped_unchanged_total += page_status_counts.get(STATUS_UNCHANGED, 0)
 
-            print(
+            status_lines = [
                 "   Status: "
                 + " | ".join(
                     f"{STATUS_LABELS[key]} {page_status_counts.get(key, 0):02d}"
                     for key in (STATUS_NEW, STATUS_CHANGED, STATUS_UNCHANGED)
                 )
-            )
+            ]
             if page_status_counts.get(STATUS_UNCHANGED, 0):
                 hint = "übersprungen" if skip_unchanged else "markiert"
-                print(
+                status_lines.append(
                     f"   ↷ {page_status_counts[STATUS_UNCHANGED]:02d} unveränderte Einträge {hint}"
                 )
+            print_lines(status_lines)
 
             detail_candidates = [
                 item
@@ -1853,8 +2517,6 @@ def run_scraper_flow_from_config(config, *, interactive=True):
                 else:
                     developer_logger("Keine Detailabrufe nötig – alle Anzeigen unverändert")
 
-            progress_callback = None
-            progress_finalize = None
             if enable_detail_capture and detail_candidates:
                 detail_requests += len(detail_candidates)
                 (
@@ -1862,20 +2524,21 @@ def run_scraper_flow_from_config(config, *, interactive=True):
                     progress_finalize,
                 ) = build_inline_progress_printer(len(detail_candidates))
 
-            enrich_listings_with_details(
-                detail_candidates,
-                enable_detail_capture,
-                delay_range=detail_delay_range,
-                max_items=None,
-                progress_callback=progress_callback,
-                max_workers=detail_worker_count,
-                rate_limit_permits=detail_rate_limit_permits,
-            )
+                enrich_listings_with_details(
+                    detail_candidates,
+                    enable_detail_capture,
+                    max_items=None,
+                    progress_callback=progress_callback,
+                    max_workers=detail_worker_count,
+                    rate_limit_permits=detail_rate_limit_permits,
+                    executor=detail_executor,
+                    rate_limiter=detail_rate_limiter,
+                )
 
-            if progress_finalize:
-                progress_finalize()
-            if developer_logger and enable_detail_capture and detail_candidates:
-                developer_logger("Detailabrufe abgeschlossen")
+                if progress_finalize:
+                    progress_finalize()
+                if developer_logger:
+                    developer_logger("Detailabrufe abgeschlossen")
 
             listings_to_persist = (
                 detail_candidates if skip_unchanged else eligible_listings
@@ -1901,12 +2564,11 @@ def run_scraper_flow_from_config(config, *, interactive=True):
                 **save_kwargs,
             )
             total_saved += saved_in_page
-            print(f"{saved_in_page:02d} von {found_on_page:02d} gespeichert")
             if developer_logger:
                 developer_logger(
                     f"Speicherung abgeschlossen – {saved_in_page} Einträge übernommen"
                 )
-            print()
+            print_lines([f"{saved_in_page:02d} von {found_on_page:02d} gespeichert", ""])
 
             if limit is not None and total_saved >= limit:
                 print(
@@ -1915,29 +2577,24 @@ def run_scraper_flow_from_config(config, *, interactive=True):
                 )
                 break
 
-            stop = False
-            for item in listings:
-                if item["date"] and is_older_than_days(item["date"], days, item["promoted"]):
-                    print(
-                        f"ℹ️  Anzeige älter als {days} Tage gefunden "
-                        f"(ID {item['id']}) auf Seite {page}. Stop."
+            if older_item is not None:
+                print(
+                    f"ℹ️  Anzeige älter als {days} Tage gefunden "
+                    f"(ID {older_item['id']}) auf Seite {page}. Stop."
+                )
+                if developer_logger:
+                    developer_logger(
+                        f"Abbruchkriterium erreicht: Anzeige {older_item.get('id')} ist älter als {days} Tage"
                     )
-                    if developer_logger:
-                        developer_logger(
-                            f"Abbruchkriterium erreicht: Anzeige {item.get('id')} ist älter als {days} Tage"
-                        )
-                    stop = True
-                    break
-            if stop:
                 break
-
-            sleep_time = random.uniform(2, 4)
-            time.sleep(sleep_time)
-            if developer_logger:
-                developer_logger(f"Warte {sleep_time:.2f}s vor nächster Seite")
     finally:
-        if db_connection is not None:
-            db_connection.close()
+        # A prefetch still sleeping skips its request; nobody waits for it.
+        stop_prefetch.set()
+        page_executor.shutdown(wait=False, cancel_futures=True)
+        if detail_executor is not None:
+            detail_executor.shutdown(wait=True)
+        # Drop the idle keep-alive sockets; the next run reconnects lazily.
+        HTTP_POOL.clear()
 
     total_duration = max(0.0, time.time() - start_time)
     if developer_logger:
@@ -1965,12 +2622,13 @@ def run_scraper_flow_from_config(config, *, interactive=True):
     elif db_path:
         aggregate_data(
             db_path=db_path,
+            db_connection=db_connection,
             search_term=config.search_term,
             days=days,
         )
     if interactive:
         if db_path:
-            return analysis_menu(db_path=db_path)
+            return analysis_menu(db_path=db_path, conn=db_connection)
         print("ℹ️  Keine SQLite-Datenbank verfügbar – Analyse übersprungen.")
         return "main"
     return {
@@ -7,7 +7,8 @@ import json
 import os
 import sqlite3
 from datetime import datetime, timedelta
-from typing import Iterable, Mapping, Optional, Sequence
+from operator import itemgetter
+from typing import Dict, Iterable, Mapping, Optional, Sequence
 
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_DB_PATH = os.path.abspath(
@@ -15,17 +16,60 @@ DEFAULT_DB_PATH = os.path.abspath(
 )
 
 
-def open_database(db_path: str) -> sqlite3.Connection:
-    """Open (and create if needed) a SQLite database at ``db_path``."""
+# Timestamps (created_at, updated_at, last_seen, changed_at) are always
+# written as ``datetime.isoformat(timespec="seconds")`` text, which sorts
+# chronologically. Filters therefore compare the raw columns (``last_seen >= ?``)
+# so SQLite can use the indexes instead of calling datetime() on every row.
+
+# Negative values are KiB: a 64 MiB page cache per connection.
+CACHE_SIZE_KIB = 65536
+
+# A run writing while the analysis menu reads (or a second run) waits this
+# long for a lock before raising "database is locked" (sqlite busy_timeout).
+BUSY_TIMEOUT_SECONDS = 5.0
+
+# Reads of the database file go through a memory map of up to 256 MiB
+# instead of read() calls into the page cache.
+MMAP_SIZE_BYTES = 256 * 1024 * 1024
+
+# SQLite builds before 3.32 cap a statement at 999 bound parameters; id
+# lookups larger than this are split into several ``IN (...)`` queries.
+MAX_IN_PARAMETERS = 900
+
+
+def open_database(db_path: str, *, read_only: bool = False) -> sqlite3.Connection:
+    """Open (and create if needed) a SQLite database at ``db_path``.
+
+    ``read_only`` connections (analysis) leave the journal settings of the
+    file alone and refuse writes via ``PRAGMA query_only``.
+    """
     normalized = os.path.abspath(db_path)
     directory = os.path.dirname(normalized)
     if directory and not os.path.isdir(directory):
         os.makedirs(directory, exist_ok=True)
-    conn = sqlite3.connect(normalized)
+    conn = sqlite3.connect(normalized, timeout=BUSY_TIMEOUT_SECONDS)
     conn.row_factory = sqlite3.Row
+    _configure_connection(conn, read_only=read_only)
     return conn
 
 
+def _configure_connection(conn: sqlite3.Connection, *, read_only: bool = False) -> None:
+    """Apply the journal/sync/cache settings used for scraper connections.
+
+    WAL lets the analysis menu read while a run writes, and with
+    ``synchronous=NORMAL`` a commit no longer waits for an fsync of the main
+    database file; WAL still keeps committed data consistent after a crash.
+    """
+    if read_only:
+        conn.execute("PRAGMA query_only=ON")
+    else:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute(f"PRAGMA cache_size=-{int(CACHE_SIZE_KIB)}")
+    conn.execute(f"PRAGMA mmap_size={int(MMAP_SIZE_BYTES)}")
+
+
 def init_schema(conn: sqlite3.Connection, fieldnames: Sequence[str]) -> None:
     """Ensure that the ``listings`` table and indexes exist."""
     column_defs = []
@@ -91,8 +135,10 @@ def _ensure_listing_id(values: Mapping[str, object]) -> str:
 
 
 def _calculate_listing_hash(values: Mapping[str, object]) -> str:
-    serializable = {k: values.get(k) for k in sorted(values.keys())}
-    payload = json.dumps(serializable, ensure_ascii=False, sort_keys=True)
+    # sort_keys orders the fields; only non-dict mappings need a copy.
+    if not isinstance(values, dict):
+        values = dict(values)
+    payload = json.dumps(values, ensure_ascii=False, sort_keys=True)
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
@@ -145,17 +191,19 @@ def fetch_listing_by_id(
 def fetch_listings_by_ids(
     conn: sqlite3.Connection,
     ids: Iterable[object],
-) -> Mapping[str, Mapping[str, object]]:
-    """Fetch multiple listings at once and return a mapping of ``id`` to rows."""
-
-    normalized_ids = [str(listing_id) for listing_id in ids if listing_id not in (None, "")]
-    if not normalized_ids:
-        return {}
+) -> Dict[str, Dict[str, object]]:
+    """Fetch multiple listings at once and return a new dict of ``id`` to rows."""
 
-    placeholders = ", ".join(["?"] * len(normalized_ids))
-    sql = f"SELECT * FROM listings WHERE id IN ({placeholders})"
-    rows = conn.execute(sql, normalized_ids).fetchall()
-    return {row["id"]: dict(row) for row in rows}
+    normalized_ids = list(
+        dict.fromkeys(str(listing_id) for listing_id in ids if listing_id not in (None, ""))
+    )
+    result = {}
+    for start in range(0, len(normalized_ids), MAX_IN_PARAMETERS):
+        chunk = normalized_ids[start:start + MAX_IN_PARAMETERS]
+        placeholders = ", ".join(["?"] * len(chunk))
+        sql = f"SELECT * FROM listings WHERE id IN ({placeholders})"
+        result.update((row["id"], dict(row)) for row in conn.execute(sql, chunk))
+    return result
 
 
 def upsert_many(
@@ -174,6 +222,8 @@ def upsert_many(
     now_text = now.isoformat(timespec="seconds")
     columns = list(fieldnames) + ["hash", "created_at", "updated_at", "last_seen"]
     placeholders = ", ".join(["?"] * len(columns))
+    # Always at least the four bookkeeping columns, so this yields a tuple.
+    row_getter = itemgetter(*columns)
     update_assignments = ", ".join(
         f'{col}=excluded.{col}'
         for col in columns
@@ -188,15 +238,9 @@ def upsert_many(
         " VALUES (?, ?, ?, ?, ?, ?)"
     )
 
-    def prepare_row(item: Mapping[str, object]):
-        normalized = {name: _clean_field_value(item.get(name)) for name in fieldnames}
-        normalized["id"] = _ensure_listing_id(normalized)
+    def prepare_row(normalized: Mapping[str, object]):
         listing_id = normalized["id"]
-        existing_row = conn.execute(
-            "SELECT * FROM listings WHERE id = ?",
-            (listing_id,),
-        ).fetchone()
-        existing = dict(existing_row) if existing_row else None
+        existing = existing_by_id.get(listing_id)
 
         merged = {}
         for name in fieldnames:
@@ -206,8 +250,7 @@ def upsert_many(
             else:
                 merged[name] = value
 
-        merged_hash_payload = {name: merged.get(name) for name in fieldnames}
-        merged["hash"] = _calculate_listing_hash(merged_hash_payload)
+        merged["hash"] = _calculate_listing_hash(merged)
         merged["created_at"] = (
             existing.get("created_at") if existing is not None else now_text
         )
@@ -240,15 +283,37 @@ def upsert_many(
             now_text if data_changed else existing.get("updated_at")
         ) if existing is not None else now_text
 
-        row_values = [merged.get(col) for col in columns]
+        # A repeated id later in the same batch must see this version, just
+        # as it would have after a row-by-row insert.
+        existing_by_id[listing_id] = merged
+        row_values = row_getter(merged)
         return row_values, changes
 
+    normalized_items = []
+    for item in listings:
+        normalized = {name: _clean_field_value(item.get(name)) for name in fieldnames}
+        normalized["id"] = _ensure_listing_id(normalized)
+        normalized_items.append(normalized)
+
     with conn:
-        for item in listings:
-            row_values, changes = prepare_row(item)
-            conn.execute(sql, row_values)
-            if changes:
-                conn.executemany(change_sql, changes)
+        # Take the write lock before looking up the existing rows, so the
+        # lookup, the upsert and the change records form one transaction and
+        # a concurrent writer cannot slip in between them.
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        # One lookup for the whole batch instead of a SELECT per listing.
+        existing_by_id = fetch_listings_by_ids(
+            conn, [item["id"] for item in normalized_items]
+        )
+        row_batch = []
+        change_batch = []
+        for normalized in normalized_items:
+            row_values, changes = prepare_row(normalized)
+            row_batch.append(row_values)
+            change_batch.extend(changes)
+        conn.executemany(sql, row_batch)
+        if change_batch:
+            conn.executemany(change_sql, change_batch)
     return len(listings)
 
 
@@ -262,9 +327,9 @@ def fetch_recent_listings(
     params = []
     if days is not None and days > 0:
         cutoff = datetime.utcnow() - timedelta(days=days)
-        query += " WHERE datetime(last_seen) >= datetime(?)"
+        query += " WHERE last_seen >= ?"
         params.append(cutoff.isoformat(timespec="seconds"))
-    query += " ORDER BY datetime(last_seen) DESC"
+    query += " ORDER BY last_seen DESC"
     if limit is not None:
         query += " LIMIT ?"
         params.append(limit)
@@ -283,7 +348,7 @@ def _build_filter_conditions(*, days: Optional[int] = None, search: Optional[str
     params = []
     if days is not None and days > 0:
         cutoff = datetime.utcnow() - timedelta(days=days)
-        clauses.append("datetime(last_seen) >= datetime(?)")
+        clauses.append("last_seen >= ?")
         params.append(cutoff.isoformat(timespec="seconds"))
     if search:
         pattern = f"%{search.strip().lower()}%"
@@ -359,7 +424,7 @@ def fetch_model_year_stats(
     params = []
     if days is not None and days > 0:
         cutoff = datetime.utcnow() - timedelta(days=days)
-        clauses.append("datetime(last_seen) >= datetime(?)")
+        clauses.append("last_seen >= ?")
         params.append(cutoff.isoformat(timespec="seconds"))
     if search:
         pattern = f"%{search.strip().lower()}%"
@@ -424,7 +489,7 @@ def fetch_recent_price_changes(
         SELECT listing_id, old_value, new_value, changed_at
         FROM listing_changes
         WHERE field = 'price'
-        ORDER BY datetime(changed_at) DESC
+        ORDER BY changed_at DESC
         LIMIT ?
     """
     rows = conn.execute(sql, (limit,)).fetchall()
@@ -1,3 +1,4 @@
+import json
 import sys
 from pathlib import Path
 
@@ -56,6 +57,34 @@ def test_aggregate_data_from_db_respects_filters(tmp_path):
     conn.close()
 
 
+def test_aggregate_data_from_csv_groups_by_make_and_model(tmp_path):
+    csv_path = tmp_path / "raw.csv"
+    rows = [
+        {"id": "1", "make": "VW", "model": "Golf", "price": 10000, "promoted": False},
+        {"id": "2", "make": "VW", "model": "Golf", "price": None, "promoted": False},
+        {"id": "3", "make": "VW", "model": "Golf", "price": 14000, "promoted": False},
+        {"id": "4", "make": "Toyota", "model": "Aygo", "price": 7000, "promoted": False},
+    ]
+    scraper.save_raw_filtered(rows, 7, csv_filename=str(csv_path), pre_filtered=True)
+    agg_path = tmp_path / "agg.json"
+
+    result = scraper.aggregate_data(csv_filename=str(csv_path), output_json=str(agg_path))
+
+    assert result["VW Golf"] == {"count_total": 3, "count_with_price": 2, "avg_price": 12000}
+    assert result["Toyota Aygo"] == {"count_total": 1, "count_with_price": 1, "avg_price": 7000}
+    assert agg_path.is_file()
+
+
+def test_json_dumps_matches_stdlib_output_without_orjson(monkeypatch):
+    payload = {"Škoda Октавија": {"count_total": 2, "count_with_price": 1, "avg_price": 9500.5}}
+    fast = scraper._json_dumps(payload)
+    monkeypatch.setattr(scraper, "orjson", None)
+    fallback = scraper._json_dumps(payload)
+
+    assert json.loads(fast) == json.loads(fallback) == payload
+    assert "Октавија" in fallback
+
+
 def test_display_summary_counts_empty_price_as_low_price(capfd):
     stats = {
         ("Test", "Car", "Diesel"): {
@@ -91,3 +120,47 @@ def test_display_avg_price_by_model_year_from_sqlite_stats(capfd):
     assert "Test" in captured
     assert "2020" in captured
     assert "3 (1)" in captured
+
+
+def test_analysis_menu_reuses_stats_for_unchanged_filters(monkeypatch, tmp_path):
+    db_path = tmp_path / "cars.db"
+    conn = sqlite_store.open_database(str(db_path))
+    sqlite_store.init_schema(conn, scraper.DB_FIELDNAMES)
+    conn.close()
+
+    calls = []
+
+    def fake_stats(_conn, **kwargs):
+        calls.append(kwargs)
+        return {}
+
+    answers = iter(["1", "1", "0"])
+    monkeypatch.setattr("builtins.input", lambda *_: next(answers))
+    monkeypatch.setattr(scraper, "clear_screen", lambda: None)
+    monkeypatch.setattr(scraper.sqlite_store, "fetch_make_model_stats", fake_stats)
+
+    assert scraper.analysis_menu(db_path=str(db_path)) == "main"
+    assert len(calls) == 1
+
+
+def test_analysis_menu_leaves_handed_over_connection_open(monkeypatch, tmp_path):
+    db_path = tmp_path / "cars.db"
+    conn = sqlite_store.open_database(str(db_path))
+    sqlite_store.init_schema(conn, scraper.DB_FIELDNAMES)
+    used = []
+
+    def fake_stats(stats_conn, **_kwargs):
+        used.append(stats_conn)
+        return {}
+
+    answers = iter(["1", "0"])
+    monkeypatch.setattr("builtins.input", lambda *_: next(answers))
+    monkeypatch.setattr(scraper, "clear_screen", lambda: None)
+    monkeypatch.setattr(scraper.sqlite_store, "fetch_make_model_stats", fake_stats)
+
+    try:
+        assert scraper.analysis_menu(db_path=str(db_path), conn=conn) == "main"
+        assert used == [conn]
+        assert sqlite_store.count_listings(conn) == 0
+    finally:
+        conn.close()
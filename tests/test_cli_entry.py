@@ -1,6 +1,9 @@
+import sqlite3
 import sys
 from pathlib import Path
 
+import pytest
+
 SRC_DIR = Path(__file__).resolve().parents[1] / "src"
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
@@ -98,7 +101,10 @@ def test_cli_entry_triggers_non_interactive_run(monkeypatch, tmp_path):
     assert aggregate_calls and aggregate_calls[0].get("db_path") == str(db_path)
 
 
-def test_cli_details_delay_zero_propagates_none(monkeypatch, tmp_path):
+@pytest.mark.parametrize("delay, expect_limiter", [("0", False), ("0.5", True)])
+def test_cli_details_delay_controls_detail_rate_limiter(
+    monkeypatch, tmp_path, delay, expect_limiter
+):
     html_calls = []
 
     def fake_fetch(search_term, page_num):
@@ -123,11 +129,11 @@ def test_cli_details_delay_zero_propagates_none(monkeypatch, tmp_path):
     monkeypatch.setattr(scraper, "is_within_days", lambda *_, **__: True)
     monkeypatch.setattr(scraper, "is_older_than_days", lambda *_, **__: False)
 
-    captured_delay = {}
+    captured = {}
 
-    def fake_enrich(listings, enabled, delay_range=None, **kwargs):
-        captured_delay["enabled"] = enabled
-        captured_delay["delay_range"] = delay_range
+    def fake_enrich(listings, enabled, **kwargs):
+        captured["enabled"] = enabled
+        captured["rate_limiter"] = kwargs.get("rate_limiter", "missing")
 
     monkeypatch.setattr(scraper, "enrich_listings_with_details", fake_enrich)
 
@@ -167,12 +173,89 @@ def test_cli_details_delay_zero_propagates_none(monkeypatch, tmp_path):
             "1",
             "--details",
             "--details-delay",
-            "0",
+            delay,
             "--use-sqlite",
         ]
     )
 
     assert html_calls[0][0] == "aygo"
-    assert captured_delay["enabled"] is True
-    assert captured_delay["delay_range"] is None
+    assert captured["enabled"] is True
+    if expect_limiter:
+        assert isinstance(captured["rate_limiter"], scraper.TokenBucket)
+    else:
+        assert captured["rate_limiter"] is None
     assert saved["db_connection"] is not None
+
+
+def test_clear_screen_uses_ansi_instead_of_subprocess(monkeypatch):
+    written = []
+
+    class FakeTty:
+        def isatty(self):
+            return True
+
+        def write(self, text):
+            written.append(text)
+
+        def flush(self):
+            pass
+
+    monkeypatch.setattr(scraper.os, "name", "posix")
+    monkeypatch.setattr(scraper.os, "system", lambda *_: pytest.fail("no subprocess expected"))
+    monkeypatch.setattr(scraper.sys, "stdout", FakeTty())
+
+    scraper.clear_screen()
+
+    assert written == [scraper.ANSI_CLEAR_SCREEN]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_user_settings_round_trip(monkeypatch, tmp_path, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(scraper, "orjson", None)
+    settings_file = tmp_path / "user_settings.json"
+    monkeypatch.setattr(scraper, "SETTINGS_DIR", str(tmp_path))
+    monkeypatch.setattr(scraper, "USER_SETTINGS_FILE", str(settings_file))
+    settings = scraper.UserSettings(
+        search_term="шкода октавиа", days=3, limit=50, detail_delay_range=(0.5, 1.5)
+    )
+
+    scraper.save_user_settings(settings)
+
+    assert scraper.load_user_settings() == settings
+    assert "шкода октавиа" in settings_file.read_text(encoding="utf-8")
+
+
+def test_load_user_settings_falls_back_on_broken_file(monkeypatch, tmp_path):
+    settings_file = tmp_path / "user_settings.json"
+    settings_file.write_bytes(b"{\"days\": 3,")
+    monkeypatch.setattr(scraper, "USER_SETTINGS_FILE", str(settings_file))
+
+    assert scraper.load_user_settings() == scraper.UserSettings()
+
+
+def test_run_closes_database_when_the_summary_fails(monkeypatch, tmp_path):
+    opened = []
+    real_open = scraper.sqlite_store.open_database
+
+    def tracking_open(path, **kwargs):
+        conn = real_open(path, **kwargs)
+        opened.append(conn)
+        return conn
+
+    def failing_section(*_, **__):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(scraper.sqlite_store, "open_database", tracking_open)
+    monkeypatch.setattr(scraper.sqlite_store, "DEFAULT_DB_PATH", str(tmp_path / "cars.db"))
+    monkeypatch.setattr(scraper, "fetch_listing_page", lambda *_: None)
+    monkeypatch.setattr(scraper, "print_section", failing_section)
+
+    with pytest.raises(RuntimeError):
+        scraper.run_scraper_flow_from_config(
+            scraper.ScraperConfig(search_term="golf", db_path="x"), interactive=False
+        )
+
+    assert len(opened) == 1
+    with pytest.raises(sqlite3.ProgrammingError):
+        opened[0].execute("SELECT 1")
@@ -94,3 +94,97 @@ def test_enrich_listings_rate_limit_restricts_parallel_calls(monkeypatch):
     )
 
     assert max_active == 1
+
+
+def test_enrich_listings_reuses_shared_executor(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    monkeypatch.setattr(
+        scraper,
+        "fetch_detail_attributes",
+        lambda link: {"color": f"color_{link.rsplit('/', 1)[-1]}"},
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for page in range(2):
+            listings = [{"id": str(page), "link": f"http://example.com/{page}"}]
+            scraper.enrich_listings_with_details(listings, True, executor=executor)
+            assert listings[0]["color"] == f"color_{page}"
+        # Still usable: the helper must not shut down a pool it does not own.
+        assert executor.submit(lambda: "alive").result() == "alive"
+
+
+def test_enrich_listings_paces_requests_with_shared_rate_limiter(monkeypatch):
+    class CountingLimiter:
+        def __init__(self):
+            self.calls = 0
+            self.lock = threading.Lock()
+
+        def acquire(self, cancel_event=None):
+            with self.lock:
+                self.calls += 1
+            return True
+
+    sleeps = []
+    monkeypatch.setattr(scraper.time, "sleep", lambda seconds: sleeps.append(seconds))
+    monkeypatch.setattr(scraper, "fetch_detail_attributes", lambda link: {"fuel": "Diesel"})
+    listings = [{"id": str(i), "link": f"http://example.com/{i}"} for i in range(4)]
+    limiter = CountingLimiter()
+
+    scraper.enrich_listings_with_details(listings, True, max_workers=2, rate_limiter=limiter)
+
+    assert limiter.calls == 4
+    assert sleeps == []
+    assert all(listing["fuel"] == "Diesel" for listing in listings)
+
+
+def test_detail_rate_limiter_spaces_requests_by_the_mean_pause():
+    limiter = scraper._detail_rate_limiter((1.0, 3.0))
+    assert limiter.rate == 0.5
+    assert limiter.capacity == 1
+    assert scraper._detail_rate_limiter(None) is None
+    assert scraper._detail_rate_limiter((0.0, 0.0)) is None
+
+
+def test_detail_worker_pauses_after_releasing_permit(monkeypatch):
+    events = []
+
+    class RecordingSemaphore:
+        def acquire(self):
+            events.append("acquire")
+
+        def release(self):
+            events.append("release")
+
+    monkeypatch.setattr(scraper, "fetch_detail_attributes", lambda link: events.append("fetch") or {"km": 1})
+    monkeypatch.setattr(scraper.time, "sleep", lambda seconds: events.append("sleep"))
+
+    details = scraper._detail_worker(
+        "http://example.com/1",
+        delay_range=(0.5, 0.5),
+        rate_limit_semaphore=RecordingSemaphore(),
+    )
+
+    assert details == {"km": 1}
+    assert events == ["acquire", "fetch", "release", "sleep"]
+
+
+def test_inline_progress_printer_ends_line_once(capsys):
+    callback, finalize = scraper.build_inline_progress_printer(3, symbol="#")
+
+    for _ in range(4):
+        callback()
+    finalize()
+
+    assert capsys.readouterr().out == "###\n"
+    assert scraper.build_inline_progress_printer(0) == (None, None)
+
+
+def test_inline_progress_printer_finalize_closes_partial_line(capsys):
+    callback, finalize = scraper.build_inline_progress_printer(3, symbol="#")
+
+    callback()
+    finalize()
+    finalize()
+
+    assert capsys.readouterr().out == "#\n"
@@ -0,0 +1,217 @@
+import gzip
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import urllib3
+
+import scraperReklama5 as scraper
+
+
+def test_fetch_detail_attributes_does_not_retry_missing_pages(monkeypatch):
+    calls = []
+
+    def fake_get(url, timeout, retries=None):
+        calls.append(url)
+        raise scraper.HttpStatusError(404, "Not Found")
+
+    monkeypatch.setattr(scraper, "_http_get", fake_get)
+    monkeypatch.setattr(scraper, "_missing_detail_urls", set())
+    monkeypatch.setattr(scraper.time, "sleep", lambda *_: None)
+
+    url = "https://www.reklama5.mk/AdDetails?ad=404"
+    assert scraper.fetch_detail_attributes(url) == {}
+    assert scraper.fetch_detail_attributes(url) == {}
+    assert calls == [url]
+
+
+def _serve(statuses):
+    """Serve the given statuses in order on a local port; returns (server, hits)."""
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status = statuses[min(len(hits), len(statuses) - 1)]
+            hits.append(self.path)
+            body = "<html><body>ok</body></html>".encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, hits
+
+
+def test_fetch_listing_page_retries_transient_errors(monkeypatch):
+    server, hits = _serve([503, 503, 200])
+    port = server.server_address[1]
+    monkeypatch.setattr(
+        scraper, "BASE_URL_TEMPLATE", f"http://127.0.0.1:{port}/Search?q={{search_term}}&page={{page_num}}"
+    )
+    try:
+        html = scraper.fetch_listing_page("golf", 1, retries=3, backoff_seconds=0)
+    finally:
+        server.shutdown()
+
+    assert html == b"<html><body>ok</body></html>"
+    assert len(hits) == 3
+
+
+def test_fetch_listing_page_gives_up_after_retries(monkeypatch):
+    server, hits = _serve([503])
+    port = server.server_address[1]
+    monkeypatch.setattr(
+        scraper, "BASE_URL_TEMPLATE", f"http://127.0.0.1:{port}/Search?q={{search_term}}&page={{page_num}}"
+    )
+    try:
+        assert scraper.fetch_listing_page("golf", 1, retries=3, backoff_seconds=0) is None
+    finally:
+        server.shutdown()
+
+    assert len(hits) == 3
+
+
+def test_prefetch_listing_page_skips_request_after_cancel(monkeypatch):
+    calls = []
+    monkeypatch.setattr(scraper, "fetch_listing_page", lambda term, page: calls.append(page) or "html")
+    monkeypatch.setattr(scraper.time, "sleep", lambda *_: None)
+    cancel = threading.Event()
+
+    assert scraper._prefetch_listing_page("golf", 2, cancel_event=cancel) == "html"
+    cancel.set()
+    assert scraper._prefetch_listing_page("golf", 3, cancel_event=cancel) is None
+    assert calls == [2]
+
+
+def test_token_bucket_waits_only_after_burst(monkeypatch):
+    clock = [100.0]
+    waits = []
+
+    def fake_sleep(seconds):
+        waits.append(round(seconds, 3))
+        clock[0] += seconds
+
+    monkeypatch.setattr(scraper.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(scraper.time, "sleep", fake_sleep)
+    bucket = scraper.TokenBucket(0.5, capacity=2)
+
+    assert bucket.acquire() and bucket.acquire()
+    assert waits == []
+    assert bucket.acquire()
+    assert waits == [2.0]
+    clock[0] += 10  # slow processing refills the bucket, capped at capacity
+    assert bucket.acquire() and bucket.acquire()
+    assert waits == [2.0]
+
+
+def test_token_bucket_acquire_stops_when_cancelled():
+    bucket = scraper.TokenBucket(0.001, capacity=1)
+    assert bucket.acquire()
+    cancel = threading.Event()
+    cancel.set()
+    assert bucket.acquire(cancel) is False
+
+
+def test_listing_page_url_matches_template_format(monkeypatch):
+    for template in (
+        scraper.DEFAULT_BASE_URL_TEMPLATE,
+        "https://example.com/{page_num}/s?q={search_term}&p={page_num}",
+        "https://example.com/s?q={search_term}&page={page_num:03d}",
+    ):
+        monkeypatch.setattr(scraper, "BASE_URL_TEMPLATE", template)
+        for term, page in (("vw golf", 1), ("", 12), ("шкода/ä", 150)):
+            expected = template.format(search_term=scraper.quote_plus(term), page_num=page)
+            assert scraper.listing_page_url(term, page) == expected
+
+
+def test_fetch_listing_page_requests_and_decodes_gzip(monkeypatch):
+    body = b"<html><body>gzipped</body></html>"
+    seen_encodings = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            seen_encodings.append(self.headers.get("Accept-Encoding"))
+            payload = gzip.compress(body)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(
+        scraper,
+        "BASE_URL_TEMPLATE",
+        f"http://127.0.0.1:{server.server_address[1]}/Search?q={{search_term}}&page={{page_num}}",
+    )
+    try:
+        html = scraper.fetch_listing_page("golf", 1, backoff_seconds=0)
+    finally:
+        server.shutdown()
+
+    assert html == body
+    assert "gzip" in seen_encodings[0]
+
+
+def test_build_retry_backs_off_with_cap_and_jitter():
+    retry = scraper._build_retry(3, 2)
+
+    assert 429 in retry.status_forcelist
+    assert retry.backoff_max == scraper.RETRY_BACKOFF_MAX
+    assert retry.backoff_jitter == 2
+    assert scraper._build_retry(3, 0).backoff_jitter == 0
+
+
+def test_build_retry_waits_backoff_seconds_before_first_retry(monkeypatch):
+    monkeypatch.setattr(scraper.random, "random", lambda: 0.0)
+    retry = scraper._build_retry(4, 2)
+    waits = []
+    for _ in range(3):
+        retry = retry.increment("GET", "/", response=urllib3.HTTPResponse(status=503))
+        waits.append(retry.get_backoff_time())
+
+    assert waits == [2, 4, 8]
+    assert scraper._build_retry(4, 0).increment(
+        "GET", "/", response=urllib3.HTTPResponse(status=503)
+    ).get_backoff_time() == 0
+
+
+def test_listing_pages_are_paced_from_the_first_page(monkeypatch):
+    clock = [100.0]
+    requests_at = []
+
+    def fake_sleep(seconds):
+        clock[0] += seconds
+
+    monkeypatch.setattr(scraper.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(scraper.time, "sleep", fake_sleep)
+    monkeypatch.setattr(
+        scraper, "fetch_listing_page", lambda term, page: requests_at.append(clock[0]) or "html"
+    )
+    bucket = scraper.TokenBucket(scraper.LISTING_PAGE_RATE, capacity=scraper.LISTING_PAGE_BURST)
+
+    for page in (1, 2, 3):
+        scraper._prefetch_listing_page("golf", page, rate_limiter=bucket)
+    clock[0] += 30  # a slow page must not allow a burst afterwards
+    for page in (4, 5):
+        scraper._prefetch_listing_page("golf", page, rate_limiter=bucket)
+
+    gaps = [round(b - a, 3) for a, b in zip(requests_at, requests_at[1:])]
+    assert gaps[:2] == [2.5, 2.5]
+    assert all(gap >= 2.5 for gap in gaps)
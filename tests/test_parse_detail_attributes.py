@@ -0,0 +1,87 @@
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import scraperReklama5 as scraper
+
+
+SAMPLE_DETAIL = """
+<html><head><meta charset="utf-8"></head><body>
+<div class="row mt-3">
+  <div class="col-5">Марка:</div>
+  <div class="col-7">Volkswagen</div>
+</div>
+<div class="row mt-3">
+  <div class="col-5">Модел</div>
+  <div class="col-7"> Golf </div>
+</div>
+<div class="row mt-3">
+  <div class="col-5">Година:</div>
+  <div class="col-7">2017 год.</div>
+</div>
+<div class="row mt-3">
+  <div class="col-5">Километри:</div>
+  <div class="col-7">85.000 км</div>
+</div>
+<div class="row mt-3">
+  <div class="col-5">Гориво:</div>
+  <div class="col-7">Дизел</div>
+</div>
+<div class="row mt-3">
+  <div class="col-5">Сила на моторот:</div>
+  <div class="col-7">110 kW (150 кс)</div>
+</div>
+<div class="row mt-3">
+  <div class="col-5">Боја:</div>
+  <div class="col-3">ignored</div>
+  <div class="col-7">Сива</div>
+</div>
+<div class="row mt-3">
+  <div class="col-5">Непознато:</div>
+  <div class="col-7">x</div>
+</div>
+<div class="row mt-3">
+  <div class="col-5">Регистрација:</div>
+</div>
+<div class="row">
+  <div class="col-5">Менувач:</div>
+  <div class="col-7">Рачен</div>
+</div>
+</body></html>
+"""
+
+EXPECTED = {
+    "make": "Volkswagen",
+    "model": "Golf",
+    "year": 2017,
+    "km": 85000,
+    "fuel": "Дизел",
+    "kw": 110,
+    "ps": 150,
+    "color": "Сива",
+}
+
+
+def test_parse_detail_attributes_maps_labels_to_fields():
+    assert scraper.parse_detail_attributes(SAMPLE_DETAIL) == EXPECTED
+
+
+def test_parse_detail_attributes_accepts_bytes():
+    html = SAMPLE_DETAIL.encode("utf-8")
+    assert scraper.parse_detail_attributes(html, encoding="utf-8") == EXPECTED
+
+
+def test_parse_detail_attributes_normalizes_unusual_labels():
+    html = """
+    <div class="row mt-3"><div class="col-5">МАРКА::</div><div class="col-7">Opel</div></div>
+    <div class="row mt-3"><div class="col-5">kласа на емисија</div><div class="col-7">Euro 6</div></div>
+    <div class="row mt-3"><div class="col-5">123</div><div class="col-7">x</div></div>
+    """
+
+    result = scraper.parse_detail_attributes(html)
+
+    assert result["make"] == "Opel"
+    assert result["emission_class"] == "Euro 6"
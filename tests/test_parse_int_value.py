@@ -0,0 +1,35 @@
+import re
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from scraperReklama5 import RE_SPEC_KM, _collapse_whitespace, extract_first_int, parse_int_value
+
+
+def test_parse_int_value_keeps_only_ascii_digits():
+    assert parse_int_value("85 000 км") == 85000
+    assert parse_int_value("1.234.567 km") == 1234567
+    assert parse_int_value("١٢ 3") == 3
+
+
+def test_parse_int_value_returns_none_without_digits():
+    assert parse_int_value("Нема") is None
+    assert parse_int_value("") is None
+
+
+def test_extract_first_int_reads_matched_group():
+    assert extract_first_int("2017 г. 85 000 km", RE_SPEC_KM) == 85000
+    assert extract_first_int("2017 г.", RE_SPEC_KM) is None
+
+
+def test_collapse_whitespace_matches_regex_normalization():
+    for text in ("", " ", "\t\n", " 2017 г.,\xa0 85 000 km ", "a b", "x  ", "\x1ckm"):
+        assert _collapse_whitespace(text) == re.sub(r"\s+", " ", text)
+
+
+def test_extract_first_int_accepts_pattern_strings():
+    assert extract_first_int("Снага: 110 KW", r"(\d+)\s*kw") == 110
+    assert extract_first_int("Снага: 110 KW", r"(\d+)\s*kw") == 110
+    assert extract_first_int("без бројки", r"(\d+)\s*kw") is None
@@ -0,0 +1,101 @@
+import sys
+from datetime import datetime
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import scraperReklama5 as scraper
+
+
+SAMPLE_PAGE = """
+<html><head><meta charset="utf-8"></head><body>
+<div class="row ad-top-div">
+  <div class="promotedBtn">Promoted</div>
+  <h3><a class="SearchAdTitle" href="/AdDetails?ad=111&amp;cat=24">Toyota Aygo 2014</a></h3>
+  <span class="search-ad-price">6,500 €</span>
+  <div class="ad-desc-div"><p>2014 г., 120 000 km, 51 kW (69 Hp)</p></div>
+  <div class="ad-date-div-2"><span>вчера 08:30</span></div>
+  <span class="city-span">Скопје</span>
+</div>
+<div class="row ad-top-div">
+  <h3><a class="SearchAdTitle" href="/AdDetails?ad=222">VW Golf   VII</a></h3>
+  <span class="search-ad-price">По Договор</span>
+  <div class="search-ad-info"><p>Бензин
+     2017 г. <b>85 000</b> км 110 кв (150 кс)</p></div>
+  <div class="ad-desc-div"><p>Одлично <!-- note --> возило 2016</p></div>
+  <div class="ad-date-div-3"><span>12 мар 10:15</span></div>
+  <div class="ad-date-div-1"><span>2024-03-12 10:15</span></div>
+  <span class="city-span"> Битола </span>
+</div>
+<div class="row ad-top-div"><p>no title</p></div>
+<div class="row ad-top-div">
+  <h3><a class="SearchAdTitle" href="https://other.example/x">Opel Corsa</a></h3>
+  <div class="ad-desc-div"><p>Opel 1.3 CDTI, 200.000 km, 55 kW, 75 HP</p></div>
+  <div class="ad-date-div-1"><span>денес 14:02</span></div>
+</div>
+<div class="row ad-top-div-other">
+  <h3><a class="SearchAdTitle" href="/AdDetails?ad=999">Skip Me</a></h3>
+</div>
+</body></html>
+"""
+
+
+class FixedDateTime(datetime):
+    @classmethod
+    def now(cls, tz=None):  # pragma: no cover - deterministic helper
+        return cls(2024, 3, 20, 12, 0, 0, tzinfo=tz)
+
+
+def _parse_sample(monkeypatch, html=SAMPLE_PAGE):
+    monkeypatch.setattr(scraper, "datetime", FixedDateTime)
+    return scraper.parse_listing(html)
+
+
+def test_parse_listing_extracts_overview_fields(monkeypatch):
+    results = _parse_sample(monkeypatch)
+
+    assert [item["id"] for item in results] == ["111", "222", None]
+    first, second, third = results
+
+    assert first["link"] == "https://www.reklama5.mk/AdDetails?ad=111"
+    assert (first["make"], first["model"], first["year"]) == ("Toyota", "Aygo 2014", 2014)
+    assert first["price"] == 6500
+    assert (first["km"], first["kw"], first["ps"]) == (120000, 51, 69)
+    assert first["date"] == "2024-03-19 08:30"
+    assert first["city"] == "Скопје"
+    assert first["promoted"] is True
+
+    assert second["model"] == "Golf VII"
+    assert second["price"] is None
+    assert (second["year"], second["km"], second["kw"], second["ps"]) == (2017, 85000, 110, 150)
+    assert second["date"] == "2024-03-12 10:15"
+    assert second["city"] == "Битола"
+    assert second["promoted"] is False
+
+    assert third["link"] == "https://other.example/x"
+    assert third["year"] is None
+    assert (third["km"], third["kw"], third["ps"]) == (200000, 55, 75)
+    assert third["date"] == "2024-03-20 14:02"
+    assert third["city"] is None
+
+
+def test_parse_listing_leaves_detail_fields_empty(monkeypatch):
+    results = _parse_sample(monkeypatch)
+
+    assert all(list(item) == scraper.CSV_FIELDNAMES for item in results)
+    for item in results:
+        for field in scraper.DETAIL_ONLY_FIELDS:
+            assert item[field] is None
+
+
+def test_parse_listing_returns_empty_list_without_ads(monkeypatch):
+    assert _parse_sample(monkeypatch, "<html><body><p>Нема огласи</p></body></html>") == []
+
+
+def test_parse_listing_accepts_raw_utf8_bytes(monkeypatch):
+    from_text = _parse_sample(monkeypatch)
+    from_bytes = _parse_sample(monkeypatch, SAMPLE_PAGE.encode("utf-8"))
+
+    assert from_bytes == from_text
@@ -39,6 +39,53 @@ class ParseMkDateTests(TestCase):
             result = sr.parse_mk_date("денес 15:45")
         self.assertEqual(result, datetime(2024, 1, 5, 15, 45))
 
+    def test_parses_normalized_iso_text(self):
+        self.assertEqual(sr.parse_mk_date("2024-01-05 13:45"), datetime(2024, 1, 5, 13, 45))
+        self.assertEqual(sr.parse_mk_date(" 2024-01-05T13:45 "), datetime(2024, 1, 5, 13, 45))
+
+    def test_relative_dates_follow_the_clock_between_calls(self):
+        class NextDay(FixedDateTime):
+            @classmethod
+            def now(cls, tz=None):  # pragma: no cover - deterministic helper
+                return cls(2024, 1, 6, 12, 0, 0, tzinfo=tz)
+
+        with patch.object(sr, "datetime", FixedDateTime):
+            first = sr.parse_mk_date("денес 10:00")
+        with patch.object(sr, "datetime", NextDay):
+            second = sr.parse_mk_date("денес 10:00")
+        self.assertEqual(first, datetime(2024, 1, 5, 10, 0))
+        self.assertEqual(second, datetime(2024, 1, 6, 10, 0))
+
+    def test_cached_absolute_dates_still_resolve_year_per_call(self):
+        class MidYear(FixedDateTime):
+            @classmethod
+            def now(cls, tz=None):  # pragma: no cover - deterministic helper
+                return cls(2024, 6, 1, 12, 0, 0, tzinfo=tz)
+
+        with patch.object(sr, "datetime", MidYear):
+            first = sr.parse_mk_date("31 дек 23:45")
+        with patch.object(sr, "datetime", FixedDateTime):
+            second = sr.parse_mk_date("31 дек 23:45")
+        self.assertEqual(first, datetime(2023, 12, 31, 23, 45))
+        self.assertEqual(second, datetime(2023, 12, 31, 23, 45))
+        with patch.object(sr, "datetime", FixedDateTime):
+            self.assertEqual(sr.parse_mk_date("2 јан 09:00"), datetime(2024, 1, 2, 9, 0))
+        self.assertIsNone(sr.parse_mk_date("31 xyz 23:45"))
+        self.assertIsNone(sr.parse_mk_date("31 дек 23:45:10"))
+
+    def test_explicit_now_anchors_relative_dates_and_year(self):
+        now = datetime(2024, 1, 5, 12, 0, 0)
+        self.assertEqual(sr.parse_mk_date("вчера 08:30", now), datetime(2024, 1, 4, 8, 30))
+        self.assertEqual(sr.parse_mk_date("31 дек 23:45", now), datetime(2023, 12, 31, 23, 45))
+        self.assertEqual(sr.parse_mk_date("2 јан 09:00", now), datetime(2024, 1, 2, 9, 0))
+
+    def test_window_checks_use_the_given_now(self):
+        now = datetime(2024, 1, 5, 12, 0, 0)
+        self.assertTrue(sr.is_within_days("вчера 08:30", 2, False, now=now))
+        self.assertFalse(sr.is_within_days("2023-12-20 10:00", 7, False, now=now))
+        self.assertTrue(sr.is_older_than_days("2023-12-20 10:00", 7, False, now=now))
+        self.assertFalse(sr.is_older_than_days("2023-12-20 10:00", 7, True, now=now))
+
 
 if __name__ == "__main__":
     import unittest
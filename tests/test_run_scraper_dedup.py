@@ -1,4 +1,5 @@
 import sys
+import time
 from pathlib import Path
 
 SRC_DIR = Path(__file__).resolve().parents[1] / "src"
@@ -47,6 +48,7 @@ def test_run_scraper_filters_duplicate_ids(monkeypatch, tmp_path):
     monkeypatch.setattr(scraper, "is_older_than_days", lambda *_, **__: False)
     monkeypatch.setattr(scraper, "enrich_listings_with_details", lambda *_, **__: None)
     monkeypatch.setattr(scraper.time, "sleep", lambda *_: None)
+    monkeypatch.setattr(scraper, "LISTING_PAGE_RATE", 1000.0)
 
     aggregate_calls = []
 
@@ -103,6 +105,7 @@ def test_run_scraper_pre_filtered_saves_skip_extra_filter(monkeypatch, tmp_path)
     monkeypatch.setattr(scraper, "is_older_than_days", lambda *_, **__: False)
     monkeypatch.setattr(scraper, "enrich_listings_with_details", lambda *_, **__: None)
     monkeypatch.setattr(scraper.time, "sleep", lambda *_: None)
+    monkeypatch.setattr(scraper, "LISTING_PAGE_RATE", 1000.0)
     monkeypatch.setattr(scraper, "aggregate_data", lambda **_: {})
 
     config = scraper.ScraperConfig(
@@ -115,3 +118,79 @@ def test_run_scraper_pre_filtered_saves_skip_extra_filter(monkeypatch, tmp_path)
     scraper.run_scraper_flow_from_config(config, interactive=False)
 
     assert call_counter["count"] == len(listings_by_html["page-1"])
+
+
+def test_run_scraper_drops_ids_repeated_on_the_same_page(monkeypatch, tmp_path):
+    db_path = tmp_path / "cars.db"
+    html_pages = {1: "page-1", 2: "page-2"}
+    listings_by_html = {
+        "page-1": [_make_listing("1"), _make_listing("1"), _make_listing("2")],
+        "page-2": [_make_listing("2"), _make_listing("3"), _make_listing("3")],
+    }
+    saved_batches = []
+
+    def fake_save(rows, *_args, **_kwargs):
+        saved_batches.append([row["id"] for row in rows])
+        return len(rows)
+
+    monkeypatch.setattr(scraper, "fetch_listing_page", lambda term, page: html_pages.get(page))
+    monkeypatch.setattr(scraper, "parse_listing", lambda html: listings_by_html.get(html, []))
+    monkeypatch.setattr(scraper, "is_within_days", lambda *_, **__: True)
+    monkeypatch.setattr(scraper, "is_older_than_days", lambda *_, **__: False)
+    monkeypatch.setattr(scraper, "enrich_listings_with_details", lambda *_, **__: None)
+    monkeypatch.setattr(scraper, "save_raw_filtered", fake_save)
+    monkeypatch.setattr(scraper, "aggregate_data", lambda **_: {})
+    monkeypatch.setattr(scraper.time, "sleep", lambda *_: None)
+    monkeypatch.setattr(scraper, "LISTING_PAGE_RATE", 1000.0)
+
+    config = scraper.ScraperConfig(
+        search_term="test",
+        days=5,
+        enable_detail_capture=False,
+        db_path=str(db_path),
+    )
+
+    result = scraper.run_scraper_flow_from_config(config, interactive=False)
+
+    assert saved_batches == [["1", "2"], ["3"]]
+    assert result["total_saved"] == 3
+
+
+def test_run_scraper_does_not_prefetch_past_the_limit(monkeypatch, tmp_path):
+    db_path = tmp_path / "cars.db"
+    fetched_pages = []
+
+    def fake_fetch(term, page):
+        fetched_pages.append(page)
+        return f"page-{page}"
+
+    def fake_save(rows, *_args, **_kwargs):
+        # Leaves a background fetch time to fire before the run stops.
+        time.sleep(0.05)
+        return len(rows)
+
+    monkeypatch.setattr(scraper, "fetch_listing_page", fake_fetch)
+    monkeypatch.setattr(
+        scraper,
+        "parse_listing",
+        lambda html: [_make_listing(f"{html}-{i}") for i in range(3)],
+    )
+    monkeypatch.setattr(scraper, "is_within_days", lambda *_, **__: True)
+    monkeypatch.setattr(scraper, "is_older_than_days", lambda *_, **__: False)
+    monkeypatch.setattr(scraper, "enrich_listings_with_details", lambda *_, **__: None)
+    monkeypatch.setattr(scraper, "save_raw_filtered", fake_save)
+    monkeypatch.setattr(scraper, "aggregate_data", lambda **_: {})
+    monkeypatch.setattr(scraper, "LISTING_PAGE_RATE", 1000.0)
+
+    config = scraper.ScraperConfig(
+        search_term="test",
+        days=5,
+        limit=2,
+        enable_detail_capture=False,
+        db_path=str(db_path),
+    )
+
+    result = scraper.run_scraper_flow_from_config(config, interactive=False)
+
+    assert result["total_saved"] == 2
+    assert fetched_pages == [1]
@@ -0,0 +1,81 @@
+import csv
+import sqlite3
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import scraperReklama5 as scraper
+
+
+def _row(ad_id, **overrides):
+    row = {name: None for name in scraper.CSV_FIELDNAMES}
+    row.update(id=ad_id, link=f"https://www.reklama5.mk/AdDetails?ad={ad_id}", promoted=False)
+    row.update(overrides)
+    return row
+
+
+def test_save_raw_filtered_appends_rows_below_single_header(tmp_path):
+    target = tmp_path / "raw.csv"
+
+    assert scraper.save_raw_filtered([_row("1", price=1500)], 7, csv_filename=str(target), pre_filtered=True) == 1
+    assert scraper.save_raw_filtered([_row("2", km=90000)], 7, csv_filename=str(target), pre_filtered=True) == 1
+
+    with open(target, newline="", encoding="utf-8") as handle:
+        rows = list(csv.reader(handle))
+
+    assert rows[0] == scraper.CSV_FIELDNAMES
+    assert len(rows) == 3
+    first = dict(zip(rows[0], rows[1]))
+    second = dict(zip(rows[0], rows[2]))
+    assert (first["id"], first["price"], first["km"], first["promoted"]) == ("1", "1500", "", "False")
+    assert (second["id"], second["price"], second["km"]) == ("2", "", "90000")
+
+
+def test_save_raw_filtered_fills_missing_keys_with_blanks(tmp_path):
+    target = tmp_path / "raw.csv"
+    partial = {"id": "9", "link": "http://example.com/9", "date": "2024-03-20 10:00", "promoted": False}
+
+    scraper.save_raw_filtered([partial], 7, csv_filename=str(target), pre_filtered=True)
+
+    with open(target, newline="", encoding="utf-8") as handle:
+        record = next(csv.DictReader(handle))
+
+    assert record["id"] == "9"
+    assert record["date"] == "2024-03-20 10:00"
+    assert record["make"] == ""
+    assert record["color"] == ""
+
+
+def test_save_raw_filtered_keeps_recent_non_promoted_rows(tmp_path):
+    target = tmp_path / "raw.csv"
+    now = scraper.datetime.now()
+    recent = (now - scraper.timedelta(days=1)).strftime("%Y-%m-%d %H:%M")
+    old = (now - scraper.timedelta(days=30)).strftime("%Y-%m-%d %H:%M")
+    rows = [
+        _row("1", date=recent),
+        _row("2", date=old),
+        _row("3", date=recent, promoted=True),
+        _row("4", date=None),
+        _row("5", date=recent),
+    ]
+
+    assert scraper.save_raw_filtered(rows, 7, csv_filename=str(target)) == 2
+
+    with open(target, newline="", encoding="utf-8") as handle:
+        saved_ids = [record["id"] for record in csv.DictReader(handle)]
+    assert saved_ids == ["1", "5"]
+
+
+def test_save_raw_filtered_writes_rows_to_database():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    scraper.sqlite_store.init_schema(conn, scraper.DB_FIELDNAMES)
+    rows = [_row("1", price=1500, _status="new"), _row("2", km=90000)]
+
+    assert scraper.save_raw_filtered(rows, 7, pre_filtered=True, db_connection=conn) == 2
+
+    stored = {row["id"]: tuple(row) for row in conn.execute("SELECT id, price, km FROM listings")}
+    assert stored == {"1": ("1", 1500, None), "2": ("2", None, 90000)}
@@ -3,6 +3,8 @@ import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import pytest
+
 SRC_DIR = Path(__file__).resolve().parents[1] / "src"
 sys.path.insert(0, str(SRC_DIR))
 
@@ -120,6 +122,36 @@ def test_upsert_many_skips_null_overwrites_and_keeps_updated_at():
     assert change_rows == 0
 
 
+def test_upsert_many_batches_new_existing_and_repeated_ids():
+    conn = make_connection()
+    ts1 = datetime(2024, 1, 5, 13, 0, 0)
+    ts2 = datetime(2024, 1, 6, 9, 0, 0)
+
+    sqlite_store.upsert_many(conn, [base_listing()], scraper.DB_FIELDNAMES, timestamp=ts1)
+    sqlite_store.upsert_many(
+        conn,
+        [
+            base_listing({"price": 14000}),
+            base_listing({"id": "new", "link": "https://example.com/new"}),
+            base_listing({"price": 13500}),
+        ],
+        scraper.DB_FIELDNAMES,
+        timestamp=ts2,
+    )
+
+    rows = {row["id"]: dict(row) for row in conn.execute("SELECT * FROM listings")}
+    assert set(rows) == {"abc", "new"}
+    assert rows["abc"]["price"] == 13500
+    assert rows["abc"]["created_at"] == iso(ts1)
+    assert rows["new"]["created_at"] == iso(ts2)
+
+    price_changes = conn.execute(
+        "SELECT old_value, new_value FROM listing_changes WHERE listing_id = ? AND field = 'price' ORDER BY id",
+        ("abc",),
+    ).fetchall()
+    assert [tuple(change) for change in price_changes] == [("15000", "14000"), ("14000", "13500")]
+
+
 def test_fetch_make_model_stats_respects_filters(monkeypatch):
     conn = make_connection()
     now = datetime(2024, 1, 10, 12, 0, 0)
@@ -213,3 +245,68 @@ def test_fetch_recent_price_changes_returns_deserialized_values():
     assert len(changes) == 1
     assert changes[0]["old_price"] == 15000
     assert changes[0]["new_price"] == 14900
+
+
+def test_open_database_enables_wal_journal(tmp_path):
+    conn = sqlite_store.open_database(str(tmp_path / "nested" / "cars.db"))
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    finally:
+        conn.close()
+
+
+def test_open_database_read_only_rejects_writes(tmp_path):
+    db_path = str(tmp_path / "cars.db")
+    writer = sqlite_store.open_database(db_path)
+    sqlite_store.init_schema(writer, scraper.DB_FIELDNAMES)
+    sqlite_store.upsert_many(writer, [base_listing()], scraper.DB_FIELDNAMES)
+    writer.close()
+
+    reader = sqlite_store.open_database(db_path, read_only=True)
+    try:
+        assert sqlite_store.count_listings(reader) == 1
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute("DELETE FROM listings")
+    finally:
+        reader.close()
+
+
+def test_last_seen_filter_uses_index():
+    conn = make_connection()
+    where_clause, params = sqlite_store._build_filter_conditions(days=3)
+
+    plan = conn.execute(
+        f"EXPLAIN QUERY PLAN SELECT id FROM listings {where_clause}", params
+    ).fetchall()
+
+    assert any("idx_listings_last_seen" in row[-1] for row in plan)
+
+
+def test_fetch_listings_by_ids_splits_large_id_lists(monkeypatch):
+    conn = make_connection()
+    monkeypatch.setattr(sqlite_store, "MAX_IN_PARAMETERS", 2)
+    sqlite_store.upsert_many(
+        conn,
+        [base_listing({"id": str(n), "link": f"https://example.com/{n}"}) for n in range(5)],
+        scraper.DB_FIELDNAMES,
+    )
+
+    rows = sqlite_store.fetch_listings_by_ids(conn, ["0", 1, "1", None, "4", "missing", 3])
+
+    assert set(rows) == {"0", "1", "3", "4"}
+    assert rows["4"]["link"] == "https://example.com/4"
+
+
+def test_upsert_many_runs_lookup_and_writes_in_one_immediate_transaction():
+    conn = make_connection()
+    statements = []
+    conn.set_trace_callback(statements.append)
+
+    sqlite_store.upsert_many(conn, [base_listing()], scraper.DB_FIELDNAMES)
+
+    assert statements[0] == "BEGIN IMMEDIATE"
+    assert statements[1].startswith("SELECT * FROM listings WHERE id IN")
+    assert statements[-1] == "COMMIT"
+    assert not conn.in_transaction